@@ -1,14 +1,27 @@
+import os
+import sys
 import time
 import socket
 import argparse
-import requests
+import httpx
+import orjson
 import psutil
 import platform
 import random
 import threading
+import queue
+import logging
+import logging.handlers
+import itertools
+import collections
+import functools
+from dataclasses import dataclass
+from typing import Optional
 from datetime import datetime, timezone
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 def get_disk_path():
     """Get appropriate disk path for the OS"""
@@ -17,6 +30,12 @@ def get_disk_path():
     return "/"
 
 
+# Static per-process values, computed once at import
+DISK_PATH = get_disk_path()
+BYTES_PER_MB = 1 << 20
+BYTES_PER_GB = 1 << 30
+
+
 # ==========================================
 # AGENT STATE ENUMS
 # ==========================================
@@ -47,8 +66,17 @@ class PCAgentState:
     Maintains realistic internal state for a PC agent.
     This makes each agent behave like a real autonomous system node.
     """
+
+    # Degradation types with cumulative weights (45% CPU, 35% memory, 15% network, 5% combined)
+    DEGRADATION_TYPES = (
+        DegradationType.CPU_PRESSURE,
+        DegradationType.MEMORY_PRESSURE,
+        DegradationType.NETWORK_SATURATION,
+        DegradationType.COMBINED
+    )
+    DEGRADATION_CUM_WEIGHTS = (0.45, 0.80, 0.95, 1.00)
     
-    def __init__(self, node_id: str):
+    def __init__(self, node_id: str, seed: Optional[int] = None):
         self.node_id = node_id
         
         # Internal health tracking
@@ -65,7 +93,6 @@ class PCAgentState:
         self.connected = False
         self.last_successful_send = None
         self.consecutive_failures = 0
-        self.reconnect_attempts = 0
         
         # Degradation simulation parameters (probabilistic)
         self.degradation_probability = 0.05  # 5% chance per cycle to start degrading
@@ -73,7 +100,11 @@ class PCAgentState:
         self.max_degradation_cycles = 12  # Max cycles before forced recovery
         self.min_degradation_cycles = 4   # Min cycles of degradation
         
-        # Lock for thread safety
+        # Per-agent RNG (no shared state with other agents in the same process).
+        # With a seed, each node gets its own reproducible stream.
+        self._rng = random.Random(f"{seed}:{node_id}" if seed is not None else None)
+        
+        # Guards publishing state shared with the sender thread
         self._lock = threading.Lock()
     
     def update_cycle(self) -> dict:
@@ -83,69 +114,86 @@ class PCAgentState:
         
         IMPORTANT: This is SIMULATION only - no OS-level changes.
         """
+        # Only the sampling loop drives the state machine, so the transition is computed
+        # without the lock; the lock just guards publishing the new state
+        (health_state, degradation_type, degradation_level,
+         cycles, event_started, message) = self._next_state()
+        
         with self._lock:
-            self.cycles_in_current_state += 1
+            self.health_state = health_state
+            self.degradation_type = degradation_type
+            self.degradation_level = degradation_level
+            self.cycles_in_current_state = cycles
             self.heartbeat_sequence += 1
+            if event_started:
+                self.last_state_change = time.time()
+            state_info = self._get_state_info()
+        
+        if message:
+            logger.info(message)
+        return state_info
+    
+    def _next_state(self) -> tuple:
+        """
+        Compute this cycle's state machine transition (probabilistic + time-based)
+        without mutating the agent.
+        
+        Returns:
+            (health_state, degradation_type, degradation_level, cycles_in_state,
+             event_started, log_message)
+        """
+        rng = self._rng
+        health_state = self.health_state
+        degradation_type = self.degradation_type
+        degradation_level = self.degradation_level
+        cycles = self.cycles_in_current_state + 1
+        event_started = False  # A degradation or recovery event begins this cycle
+        message = None
+        
+        if health_state == AgentHealthState.HEALTHY:
+            # Small chance to start degrading
+            if rng.random() < self.degradation_probability:
+                # Randomly choose degradation type with weighted probabilities (CPU most common)
+                degradation_type = rng.choices(
+                    self.DEGRADATION_TYPES, cum_weights=self.DEGRADATION_CUM_WEIGHTS
+                )[0]
+                degradation_level = rng.uniform(0.1, 0.3)  # Start mild
+                health_state = AgentHealthState.DEGRADING
+                cycles = 0
+                event_started = True
+                message = f"[{self.node_id}] State: HEALTHY -> DEGRADING ({degradation_type.value})"
+                
+        elif health_state == AgentHealthState.DEGRADING:
+            # Gradually increase degradation
+            degradation_level = min(1.0, degradation_level + rng.uniform(0.1, 0.25))
             
-            # State machine transitions (probabilistic + time-based)
-            if self.health_state == AgentHealthState.HEALTHY:
-                # Small chance to start degrading
-                if random.random() < self.degradation_probability:
-                    self._start_degradation()
-                    
-            elif self.health_state == AgentHealthState.DEGRADING:
-                # Gradually increase degradation
-                self.degradation_level = min(1.0, self.degradation_level + random.uniform(0.1, 0.25))
+            if degradation_level >= 0.6:
+                health_state = AgentHealthState.DEGRADED
+                cycles = 0
+                message = f"[{self.node_id}] State: DEGRADING -> DEGRADED (level: {degradation_level:.2f})"
                 
-                if self.degradation_level >= 0.6:
-                    self.health_state = AgentHealthState.DEGRADED
-                    self.cycles_in_current_state = 0
-                    print(f"[{self.node_id}] State: DEGRADING -> DEGRADED (level: {self.degradation_level:.2f})")
+        elif health_state == AgentHealthState.DEGRADED:
+            # Stay degraded for a while, then probabilistically recover
+            if cycles >= self.min_degradation_cycles:
+                if (cycles >= self.max_degradation_cycles or 
+                    rng.random() < self.recovery_probability):
+                    health_state = AgentHealthState.RECOVERING
+                    cycles = 0
+                    event_started = True
+                    message = f"[{self.node_id}] State: DEGRADED -> RECOVERING"
                     
-            elif self.health_state == AgentHealthState.DEGRADED:
-                # Stay degraded for a while, then probabilistically recover
-                if self.cycles_in_current_state >= self.min_degradation_cycles:
-                    if (self.cycles_in_current_state >= self.max_degradation_cycles or 
-                        random.random() < self.recovery_probability):
-                        self._start_recovery()
-                        
-            elif self.health_state == AgentHealthState.RECOVERING:
-                # Gradually decrease degradation
-                self.degradation_level = max(0.0, self.degradation_level - random.uniform(0.15, 0.3))
-                
-                if self.degradation_level <= 0.1:
-                    self.health_state = AgentHealthState.HEALTHY
-                    self.degradation_type = DegradationType.NONE
-                    self.degradation_level = 0.0
-                    self.cycles_in_current_state = 0
-                    print(f"[{self.node_id}] State: RECOVERING -> HEALTHY")
+        elif health_state == AgentHealthState.RECOVERING:
+            # Gradually decrease degradation
+            degradation_level = max(0.0, degradation_level - rng.uniform(0.15, 0.3))
             
-            return self._get_state_info()
-    
-    def _start_degradation(self):
-        """Begin a degradation event"""
-        # Randomly choose degradation type with weighted probabilities
-        weights = [0.45, 0.35, 0.15, 0.05]  # CPU most common
-        degradation_types = [
-            DegradationType.CPU_PRESSURE,
-            DegradationType.MEMORY_PRESSURE,
-            DegradationType.NETWORK_SATURATION,
-            DegradationType.COMBINED
-        ]
-        self.degradation_type = random.choices(degradation_types, weights=weights)[0]
-        self.degradation_level = random.uniform(0.1, 0.3)  # Start mild
-        self.health_state = AgentHealthState.DEGRADING
-        self.cycles_in_current_state = 0
-        self.last_state_change = time.time()
+            if degradation_level <= 0.1:
+                health_state = AgentHealthState.HEALTHY
+                degradation_type = DegradationType.NONE
+                degradation_level = 0.0
+                cycles = 0
+                message = f"[{self.node_id}] State: RECOVERING -> HEALTHY"
         
-        print(f"[{self.node_id}] State: HEALTHY -> DEGRADING ({self.degradation_type.value})")
-    
-    def _start_recovery(self):
-        """Begin recovery from degradation"""
-        self.health_state = AgentHealthState.RECOVERING
-        self.cycles_in_current_state = 0
-        self.last_state_change = time.time()
-        print(f"[{self.node_id}] State: DEGRADED -> RECOVERING")
+        return health_state, degradation_type, degradation_level, cycles, event_started, message
     
     def _get_state_info(self) -> dict:
         """Get current state information for payload"""
@@ -168,34 +216,35 @@ class PCAgentState:
         
         # Scale factor based on degradation level
         scale = self.degradation_level
+        uniform = self._rng.uniform
+        degradation_type = self.degradation_type
+        cpu = metrics["cpu"]
+        memory = metrics["memory"]
         
-        if self.degradation_type == DegradationType.CPU_PRESSURE:
+        if degradation_type == DegradationType.CPU_PRESSURE:
             # Simulate CPU pressure (gradual increase)
-            base_cpu = metrics["cpu"]["usage_percent"]
-            added = scale * random.uniform(30, 60)
-            metrics["cpu"]["usage_percent"] = min(99, base_cpu + added)
+            added = scale * uniform(30, 60)
+            cpu["usage_percent"] = min(99, cpu["usage_percent"] + added)
             
-        elif self.degradation_type == DegradationType.MEMORY_PRESSURE:
+        elif degradation_type == DegradationType.MEMORY_PRESSURE:
             # Simulate memory pressure
-            base_mem = metrics["memory"]["usage_percent"]
-            added = scale * random.uniform(25, 50)
-            metrics["memory"]["usage_percent"] = min(98, base_mem + added)
+            added = scale * uniform(25, 50)
+            memory["usage_percent"] = min(98, memory["usage_percent"] + added)
             # Memory pressure also affects CPU slightly
-            metrics["cpu"]["usage_percent"] = min(95, metrics["cpu"]["usage_percent"] + scale * 10)
+            cpu["usage_percent"] = min(95, cpu["usage_percent"] + scale * 10)
             
-        elif self.degradation_type == DegradationType.NETWORK_SATURATION:
+        elif degradation_type == DegradationType.NETWORK_SATURATION:
             # Simulate network saturation (high IO)
-            metrics["network"]["bytes_sent"] = int(metrics["network"]["bytes_sent"] * (1 + scale * 5))
-            metrics["network"]["bytes_received"] = int(metrics["network"]["bytes_received"] * (1 + scale * 5))
+            network = metrics["network"]
+            network["bytes_sent"] = int(network["bytes_sent"] * (1 + scale * 5))
+            network["bytes_received"] = int(network["bytes_received"] * (1 + scale * 5))
             # Network saturation causes some CPU overhead
-            metrics["cpu"]["usage_percent"] = min(90, metrics["cpu"]["usage_percent"] + scale * 15)
+            cpu["usage_percent"] = min(90, cpu["usage_percent"] + scale * 15)
             
-        elif self.degradation_type == DegradationType.COMBINED:
+        elif degradation_type == DegradationType.COMBINED:
             # Combined pressure - most severe
-            base_cpu = metrics["cpu"]["usage_percent"]
-            base_mem = metrics["memory"]["usage_percent"]
-            metrics["cpu"]["usage_percent"] = min(99, base_cpu + scale * random.uniform(35, 55))
-            metrics["memory"]["usage_percent"] = min(98, base_mem + scale * random.uniform(20, 40))
+            cpu["usage_percent"] = min(99, cpu["usage_percent"] + scale * uniform(35, 55))
+            memory["usage_percent"] = min(98, memory["usage_percent"] + scale * uniform(20, 40))
         
         return metrics
     
@@ -205,7 +254,6 @@ class PCAgentState:
             self.connected = True
             self.last_successful_send = time.time()
             self.consecutive_failures = 0
-            self.reconnect_attempts = 0
     
     def record_send_failure(self):
         """Record failed metric send"""
@@ -223,100 +271,344 @@ agent_state = None
 # LEGACY STRESS SIMULATION (kept for backward compatibility)
 # ==========================================
 
+@dataclass(slots=True)
+class StressEvent:
+    """Legacy stress event state"""
+    active: bool = False
+    type: Optional[str] = None
+    severity: str = "NORMAL"
+    remaining_cycles: int = 0
+
+
 # Stress event state
-stress_event = {
-    "active": False,
-    "type": None,
-    "severity": "NORMAL",
-    "remaining_cycles": 0
-}
+stress_event = StressEvent()
 
 cycle_counter = 0
 STRESS_EVERY_N_CYCLES = 3
 SEVERITY_ROTATION = ["WARNING", "CRITICAL", "CRITICAL", "WARNING"]
-severity_index = 0
+# Starts one step into the rotation (matches the original index-then-increment order)
+_severity_cycle = itertools.islice(itertools.cycle(SEVERITY_ROTATION), 1, None)
+# RNG for the legacy stress simulation (seeded by run_agent when --seed is given)
+stress_rng = random.Random()
 
 
 def maybe_trigger_stress():
     """Legacy stress trigger - kept for --demo-stress flag compatibility"""
-    global stress_event, cycle_counter, severity_index
+    global cycle_counter
     
     cycle_counter += 1
     
-    if stress_event["active"]:
-        stress_event["remaining_cycles"] -= 1
-        if stress_event["remaining_cycles"] <= 0:
-            print(f"[STRESS] Event ended: {stress_event['type']} ({stress_event['severity']})")
-            stress_event["active"] = False
-            stress_event["type"] = None
-            stress_event["severity"] = "NORMAL"
+    if stress_event.active:
+        stress_event.remaining_cycles -= 1
+        if stress_event.remaining_cycles <= 0:
+            logger.info("[STRESS] Event ended: %s (%s)", stress_event.type, stress_event.severity)
+            stress_event.active = False
+            stress_event.type = None
+            stress_event.severity = "NORMAL"
         return stress_event
     
     if cycle_counter >= STRESS_EVERY_N_CYCLES:
         cycle_counter = 0
-        severity_index = (severity_index + 1) % len(SEVERITY_ROTATION)
-        target_severity = SEVERITY_ROTATION[severity_index]
+        target_severity = next(_severity_cycle)
         stress_types = ["CPU_SPIKE", "CPU_SPIKE", "MEMORY_PRESSURE"]
-        stress_event["active"] = True
-        stress_event["type"] = random.choice(stress_types)
-        stress_event["severity"] = target_severity
-        stress_event["remaining_cycles"] = 2
-        print(f"[STRESS] Triggered: {stress_event['type']} -> {target_severity} for 2 cycles")
+        stress_event.active = True
+        stress_event.type = stress_rng.choice(stress_types)
+        stress_event.severity = target_severity
+        stress_event.remaining_cycles = 2
+        logger.info("[STRESS] Triggered: %s -> %s for 2 cycles", stress_event.type, target_severity)
     
     return stress_event
 
 
 def apply_stress_modifier(metrics, event):
     """Legacy stress modifier - kept for backward compatibility"""
-    if not event["active"]:
+    if not event.active:
         return metrics, False, "NORMAL"
     
-    stress_type = event["type"]
-    target_severity = event["severity"]
-    real_cpu = metrics["cpu"]["usage_percent"]
-    real_memory = metrics["memory"]["usage_percent"]
+    stress_type = event.type
+    target_severity = event.severity
+    cpu = metrics["cpu"]
+    memory = metrics["memory"]
+    real_cpu = cpu["usage_percent"]
+    real_memory = memory["usage_percent"]
+    uniform = stress_rng.uniform
     
     if target_severity == "CRITICAL":
         if stress_type == "CPU_SPIKE":
-            metrics["cpu"]["usage_percent"] = min(99, real_cpu + random.uniform(50, 70))
+            cpu["usage_percent"] = min(99, real_cpu + uniform(50, 70))
         elif stress_type == "MEMORY_PRESSURE":
-            metrics["memory"]["usage_percent"] = min(98, real_memory + random.uniform(35, 50))
-            metrics["cpu"]["usage_percent"] = min(90, real_cpu + random.uniform(15, 25))
+            memory["usage_percent"] = min(98, real_memory + uniform(35, 50))
+            cpu["usage_percent"] = min(90, real_cpu + uniform(15, 25))
     elif target_severity == "WARNING":
         if stress_type == "CPU_SPIKE":
-            metrics["cpu"]["usage_percent"] = min(85, real_cpu + random.uniform(25, 40))
+            cpu["usage_percent"] = min(85, real_cpu + uniform(25, 40))
         elif stress_type == "MEMORY_PRESSURE":
-            metrics["memory"]["usage_percent"] = min(85, real_memory + random.uniform(20, 35))
+            memory["usage_percent"] = min(85, real_memory + uniform(20, 35))
     
     return metrics, True, target_severity
 
 
-def collect_metrics():
-    """Collect REAL system metrics using psutil"""
-    disk_path = get_disk_path()
+# Disk usage changes slowly - reuse the statvfs result for a while
+DISK_USAGE_TTL_SECONDS = 30.0
+_disk_usage_cache = {}  # { disk_path: (monotonic time read, usage) }
+
+
+def get_disk_usage(disk_path):
+    """Return psutil.disk_usage(disk_path), cached for DISK_USAGE_TTL_SECONDS"""
+    now = time.monotonic()
+    cached = _disk_usage_cache.get(disk_path)
+    if cached is None or now - cached[0] >= DISK_USAGE_TTL_SECONDS:
+        cached = (now, psutil.disk_usage(disk_path))
+        _disk_usage_cache[disk_path] = cached
+    return cached[1]
+
+
+# On Linux, CPU usage is computed straight from /proc/stat deltas (cheaper than psutil)
+USE_PROC_STAT = platform.system() == "Linux" and os.path.exists("/proc/stat")
+_cpu_times_prev = {"total": None, "idle": None}
+
+
+def read_cpu_percent() -> float:
+    """CPU usage (%) since the previous call - non-blocking, first call returns 0.0"""
+    if not USE_PROC_STAT:
+        return psutil.cpu_percent(interval=None)
+    
+    with open("/proc/stat", "rb") as f:
+        fields = f.readline().split()
+    # user, nice, system, idle, iowait, irq, softirq, steal
+    times = [int(v) for v in fields[1:9]]
+    total = sum(times)
+    idle = times[3] + times[4]
+    
+    prev_total, prev_idle = _cpu_times_prev["total"], _cpu_times_prev["idle"]
+    _cpu_times_prev["total"], _cpu_times_prev["idle"] = total, idle
+    if prev_total is None:
+        return 0.0
+    
+    total_delta = total - prev_total
+    if total_delta <= 0:
+        return 0.0
+    busy_delta = total_delta - (idle - prev_idle)
+    return round(min(100.0, max(0.0, 100.0 * busy_delta / total_delta)), 1)
+
+
+@functools.lru_cache(maxsize=None)
+def collect_static_metrics() -> dict:
+    """Totals that only change on hardware/partition changes - read once per process"""
+    return {
+        "memory_total_mb": round(psutil.virtual_memory().total / BYTES_PER_MB, 2),
+        "disk_total_gb": round(psutil.disk_usage(DISK_PATH).total / BYTES_PER_GB, 2)
+    }
+
+
+def collect_metrics(timestamp: Optional[str] = None):
+    """Collect REAL system metrics using psutil (timestamp: ISO string for this cycle)"""
+    virtual_memory = psutil.virtual_memory()
+    disk_usage = get_disk_usage(DISK_PATH)
+    net_io = psutil.net_io_counters()
+    static = collect_static_metrics()
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
         "cpu": {
-            "usage_percent": psutil.cpu_percent(interval=1)
+            # Non-blocking: % since the previous call (the loop's sleep provides the window)
+            "usage_percent": read_cpu_percent()
         },
         "memory": {
-            "total_mb": round(psutil.virtual_memory().total / (1024 ** 2), 2),
-            "used_mb": round(psutil.virtual_memory().used / (1024 ** 2), 2),
-            "usage_percent": psutil.virtual_memory().percent
+            "total_mb": static["memory_total_mb"],
+            "used_mb": round(virtual_memory.used / BYTES_PER_MB, 2),
+            "usage_percent": virtual_memory.percent
         },
         "disk": {
-            "total_gb": round(psutil.disk_usage(disk_path).total / (1024 ** 3), 2),
-            "used_gb": round(psutil.disk_usage(disk_path).used / (1024 ** 3), 2),
-            "usage_percent": psutil.disk_usage(disk_path).percent
+            "total_gb": static["disk_total_gb"],
+            "used_gb": round(disk_usage.used / BYTES_PER_GB, 2),
+            "usage_percent": disk_usage.percent
         },
         "network": {
-            "bytes_sent": psutil.net_io_counters().bytes_sent,
-            "bytes_received": psutil.net_io_counters().bytes_recv
+            "bytes_sent": net_io.bytes_sent,
+            "bytes_received": net_io.bytes_recv
         }
     }
 
 
-def run_agent(node_id, backend_url, interval, enable_stress=False, enable_realistic=True):
+# ==========================================
+# BACKGROUND SENDER
+# ==========================================
+
+SEND_QUEUE_SIZE = 64
+# Queued in place of a payload to make the sender flush its partial batch and exit
+STOP_SENDER = None
+# How long run_agent waits for that final flush on shutdown
+SEND_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+# Transient-failure retries (backoff: 0.5s, 1s, 2s)
+SEND_MAX_RETRIES = 3
+SEND_BACKOFF_FACTOR = 0.5
+SEND_RETRY_STATUSES = frozenset((502, 503, 504))
+# Extra random pause after retries are exhausted so many nodes don't reconnect in lockstep
+SEND_RETRY_JITTER_SECONDS = 0.4
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Pooled HTTP client for the backend.
+    Uses HTTP/2 when the backend negotiates it (TLS + ALPN), otherwise HTTP/1.1 keep-alive.
+    """
+    # The transport retries failed connects itself; gateway errors are retried in post_with_retry
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        retries=SEND_MAX_RETRIES
+    )
+    return httpx.Client(transport=transport, timeout=5.0)
+
+
+def post_with_retry(client: httpx.Client, url: str, body: bytes) -> httpx.Response:
+    """POST a JSON body, backing off on 502/503/504 (honouring Retry-After)"""
+    for attempt in range(SEND_MAX_RETRIES + 1):
+        response = client.post(url, content=body, headers=JSON_HEADERS)
+        if response.status_code not in SEND_RETRY_STATUSES or attempt == SEND_MAX_RETRIES:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        time.sleep(float(retry_after) if retry_after.isdigit() else SEND_BACKOFF_FACTOR * 2**attempt)
+
+
+def enqueue_payload(send_queue: queue.Queue, payload: dict):
+    """Queue a payload for the sender thread, dropping the oldest one if full"""
+    try:
+        send_queue.put_nowait(payload)
+    except queue.Full:
+        try:
+            send_queue.get_nowait()
+        except queue.Empty:
+            pass
+        send_queue.put_nowait(payload)
+
+
+def post_pending(client: httpx.Client, node_id: str, metrics_url: str,
+                 pending: collections.deque, batch_size: int) -> bool:
+    """
+    POST the pending payloads (one, or a batch) to the backend.
+    Returns True when a batch failed in a way worth retrying, so its samples should be kept.
+    """
+    if batch_size > 1:
+        body = orjson.dumps({"node_id": node_id, "batch": list(pending)})
+    else:
+        body = orjson.dumps(pending[0])
+    state_info = pending[-1]["agent_state"]
+    retryable = False
+
+    try:
+        response = post_with_retry(client, metrics_url, body)
+
+        if response.status_code == 200:
+            agent_state.record_send_success()
+        
+            # Log state changes
+            if state_info["degradation_level"] > 0:
+                logger.info("[%s] Sent metrics - State: %s, Type: %s, Level: %.2f",
+                            node_id, state_info["health_state"],
+                            state_info["degradation_type"], state_info["degradation_level"])
+        else:
+            agent_state.record_send_failure()
+            logger.warning("[%s] WARN: Backend responded with %s", node_id, response.status_code)
+            retryable = response.status_code >= 500
+
+    except httpx.ConnectError:
+        agent_state.record_send_failure()
+        logger.error("[%s] ERROR: Cannot connect to backend (attempt %d)", node_id, agent_state.consecutive_failures)
+        time.sleep(random.uniform(0, SEND_RETRY_JITTER_SECONDS))
+        retryable = True
+    
+    except httpx.TimeoutException:
+        agent_state.record_send_failure()
+        logger.error("[%s] ERROR: Request timeout", node_id)
+        retryable = True
+    
+    except Exception as e:
+        agent_state.record_send_failure()
+        logger.error("[%s] ERROR: Failed to send metrics: %s", node_id, e)
+
+    # Single payloads are never resent: the next cycle's sample supersedes them
+    return retryable and batch_size > 1
+
+
+def sender_loop(node_id: str, backend_url: str, send_queue: queue.Queue, batch_size: int = 1,
+                max_batch_age: Optional[float] = None):
+    """
+    Drain queued payloads and POST them to the backend.
+    Owns the HTTP client (with retry/backoff) so the sampling loop never blocks on I/O.
+    With batch_size > 1, every batch_size cycles are sent as one POST to /agent/metrics/batch;
+    a partial batch is sent anyway once it is max_batch_age seconds old, or on STOP_SENDER.
+    A batch that fails to send is kept (up to SEND_QUEUE_SIZE samples) and resent with the next cycle.
+    """
+    # Persistent client so the connection to the backend is reused across cycles
+    client = create_http_client()
+    if batch_size > 1:
+        metrics_url = f"{backend_url}/agent/metrics/batch"
+    else:
+        metrics_url = f"{backend_url}/agent/metrics"
+    # Only touched by this thread, so no lock is needed around the buffer
+    pending = collections.deque(maxlen=max(batch_size, SEND_QUEUE_SIZE))
+    flush_at = None    # Monotonic time the current partial batch is sent regardless of size
+    retrying = False   # The last batch failed; resend as soon as another sample arrives
+    
+    try:
+        while True:
+            stopping = False
+            try:
+                timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+                payload = send_queue.get(timeout=timeout)
+            except queue.Empty:
+                pass  # Partial batch is stale - send it now
+            else:
+                if payload is STOP_SENDER:
+                    stopping = True
+                else:
+                    pending.append(payload)
+                    if flush_at is None and max_batch_age is not None:
+                        flush_at = time.monotonic() + max_batch_age
+                    if len(pending) < batch_size and not retrying:
+                        continue
+
+            if pending:
+                retrying = post_pending(client, node_id, metrics_url, pending, batch_size) and not stopping
+                if retrying:
+                    if max_batch_age is not None:
+                        flush_at = time.monotonic() + max_batch_age
+                else:
+                    pending.clear()
+                    flush_at = None
+
+            if stopping:
+                return
+    finally:
+        client.close()
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue to a background writer thread,
+    so a slow or piped stdout never blocks the sampling loop.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Only the agent's own logger prints; httpx logs every request at INFO
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def run_agent(node_id, backend_url, interval, enable_stress=False, enable_realistic=True, seed=None,
+              batch_size=1, start_delay=0.0):
     """
     Run the PC agent with realistic behavior simulation.
     
@@ -326,115 +618,122 @@ def run_agent(node_id, backend_url, interval, enable_stress=False, enable_realis
         interval: Metric collection interval in seconds
         enable_stress: Enable legacy stress simulation (--demo-stress)
         enable_realistic: Enable realistic probabilistic degradation (default: True)
+        seed: Optional RNG seed for reproducible simulation (combined with node_id)
+        batch_size: Number of cycles sent per POST (1 = one request per cycle)
+        start_delay: Seconds to wait before the first cycle (staggers agents launched together)
     """
     global agent_state
     
     hostname = socket.gethostname()
-    agent_state = PCAgentState(node_id)
+    agent_state = PCAgentState(node_id, seed=seed)
+    if seed is not None:
+        stress_rng.seed(f"{seed}:{node_id}:stress")
     
-    print(f"=" * 60)
-    print(f"[AGENT STARTED] Node: {node_id}")
-    print(f"[AGENT] Hostname: {hostname}")
-    print(f"[AGENT] Backend: {backend_url}")
-    print(f"[AGENT] Interval: {interval}s")
-    print(f"[AGENT] Realistic Mode: {enable_realistic}")
-    print(f"[AGENT] Legacy Stress: {enable_stress}")
-    print(f"=" * 60)
+    logger.info("=" * 60)
+    logger.info("[AGENT STARTED] Node: %s", node_id)
+    logger.info("[AGENT] Hostname: %s", hostname)
+    logger.info("[AGENT] Backend: %s", backend_url)
+    logger.info("[AGENT] Interval: %ss", interval)
+    logger.info("[AGENT] Realistic Mode: %s", enable_realistic)
+    logger.info("[AGENT] Legacy Stress: %s", enable_stress)
+    if batch_size > 1:
+        logger.info("[AGENT] Batching: %d cycles per request", batch_size)
+    logger.info("=" * 60)
     
     if enable_realistic:
-        print(f"[AGENT] Probabilistic degradation enabled:")
-        print(f"        - {agent_state.degradation_probability*100:.0f}% chance to degrade per cycle")
-        print(f"        - {agent_state.recovery_probability*100:.0f}% chance to recover per cycle")
-        print(f"        - Types: CPU_PRESSURE, MEMORY_PRESSURE, NETWORK_SATURATION, COMBINED")
+        logger.info("[AGENT] Probabilistic degradation enabled:")
+        logger.info("        - %.0f%% chance to degrade per cycle", agent_state.degradation_probability * 100)
+        logger.info("        - %.0f%% chance to recover per cycle", agent_state.recovery_probability * 100)
+        logger.info("        - Types: CPU_PRESSURE, MEMORY_PRESSURE, NETWORK_SATURATION, COMBINED")
     
     if enable_stress:
-        print(f"[AGENT] Legacy demo mode: Health drop every ~15 seconds")
+        logger.info("[AGENT] Legacy demo mode: Health drop every ~15 seconds")
 
-    reconnect_delay = 1  # Start with 1 second reconnect delay
-    max_reconnect_delay = 30  # Max 30 seconds between reconnect attempts
+    # Prime the CPU counter so the first non-blocking sample is meaningful
+    read_cpu_percent()
     
-    while True:
-        try:
-            # Collect REAL metrics
-            metrics = collect_metrics()
-            
-            # Update agent state (probabilistic state machine)
-            if enable_realistic:
-                state_info = agent_state.update_cycle()
-                metrics = agent_state.apply_degradation_to_metrics(metrics)
-            else:
-                state_info = {
-                    "health_state": "HEALTHY",
-                    "degradation_type": "NONE",
-                    "degradation_level": 0.0,
-                    "cycles_in_state": 0,
-                    "heartbeat_seq": 0,
-                    "connected": True
+    # Network I/O runs on a background thread so sampling cadence isn't tied to backend RTT
+    send_queue = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+    sender = threading.Thread(
+        target=sender_loop,
+        args=(node_id, backend_url, send_queue, batch_size, interval * batch_size),
+        name=f"{node_id}-sender",
+        daemon=True
+    )
+    sender.start()
+    
+    if start_delay > 0:
+        logger.info("[AGENT] Starting first cycle in %.1fs", start_delay)
+        time.sleep(start_delay)
+    
+    # Absolute schedule on the monotonic clock so collection time doesn't accumulate as drift
+    next_tick = time.monotonic()
+    
+    try:
+        while True:
+            try:
+                # One wall-clock read per cycle, shared by metrics and heartbeat
+                cycle_timestamp = datetime.now(timezone.utc).isoformat()
+                
+                # Collect REAL metrics
+                metrics = collect_metrics(cycle_timestamp)
+                
+                # Update agent state (probabilistic state machine)
+                if enable_realistic:
+                    state_info = agent_state.update_cycle()
+                    metrics = agent_state.apply_degradation_to_metrics(metrics)
+                else:
+                    state_info = {
+                        "health_state": "HEALTHY",
+                        "degradation_type": "NONE",
+                        "degradation_level": 0.0,
+                        "cycles_in_state": 0,
+                        "heartbeat_seq": 0,
+                        "connected": True
+                    }
+                
+                # Legacy stress simulation (if enabled)
+                simulated_event = False
+                target_severity = "NORMAL"
+                if enable_stress:
+                    event = maybe_trigger_stress()
+                    metrics, simulated_event, target_severity = apply_stress_modifier(metrics, event)
+                
+                # Build comprehensive payload with heartbeat + metrics
+                payload = {
+                    "node_id": node_id,
+                    "hostname": hostname,
+                    "metrics": metrics,
+                    # Agent state information
+                    "agent_state": state_info,
+                    "heartbeat": {
+                        "sequence": state_info["heartbeat_seq"],
+                        "timestamp": cycle_timestamp,
+                        "uptime_seconds": time.time() - agent_state.last_state_change
+                    },
+                    # Legacy fields for backward compatibility
+                    "simulated_event": simulated_event or (state_info["degradation_level"] > 0),
+                    "target_severity": target_severity if enable_stress else (
+                        "CRITICAL" if state_info["degradation_level"] > 0.7 else
+                        "WARNING" if state_info["degradation_level"] > 0.3 else "NORMAL"
+                    )
                 }
-            
-            # Legacy stress simulation (if enabled)
-            simulated_event = False
-            target_severity = "NORMAL"
-            if enable_stress:
-                event = maybe_trigger_stress()
-                metrics, simulated_event, target_severity = apply_stress_modifier(metrics, event)
-            
-            # Build comprehensive payload with heartbeat + metrics
-            payload = {
-                "node_id": node_id,
-                "hostname": hostname,
-                "metrics": metrics,
-                # Agent state information
-                "agent_state": state_info,
-                "heartbeat": {
-                    "sequence": state_info["heartbeat_seq"],
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "uptime_seconds": time.time() - agent_state.last_state_change if agent_state else 0
-                },
-                # Legacy fields for backward compatibility
-                "simulated_event": simulated_event or (state_info["degradation_level"] > 0),
-                "target_severity": target_severity if enable_stress else (
-                    "CRITICAL" if state_info["degradation_level"] > 0.7 else
-                    "WARNING" if state_info["degradation_level"] > 0.3 else "NORMAL"
-                )
-            }
-
-            response = requests.post(
-                f"{backend_url}/agent/metrics",
-                json=payload,
-                timeout=5
-            )
-
-            if response.status_code == 200:
-                agent_state.record_send_success()
-                reconnect_delay = 1  # Reset reconnect delay on success
                 
-                # Log state changes
-                if state_info["degradation_level"] > 0:
-                    print(f"[{node_id}] Sent metrics - State: {state_info['health_state']}, "
-                          f"Type: {state_info['degradation_type']}, "
-                          f"Level: {state_info['degradation_level']:.2f}")
-            else:
-                agent_state.record_send_failure()
-                print(f"[{node_id}] WARN: Backend responded with {response.status_code}")
-
-        except requests.exceptions.ConnectionError:
-            agent_state.record_send_failure()
-            print(f"[{node_id}] ERROR: Cannot connect to backend (attempt {agent_state.consecutive_failures})")
-            print(f"[{node_id}] Retrying in {reconnect_delay}s...")
-            time.sleep(reconnect_delay)
-            reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)  # Exponential backoff
-            continue
-            
-        except requests.exceptions.Timeout:
-            agent_state.record_send_failure()
-            print(f"[{node_id}] ERROR: Request timeout")
-            
-        except Exception as e:
-            agent_state.record_send_failure()
-            print(f"[{node_id}] ERROR: Failed to send metrics: {e}")
+                enqueue_payload(send_queue, payload)
+                
+            except Exception as e:
+                logger.error("[%s] ERROR: Failed to collect metrics: %s", node_id, e)
 
-        time.sleep(interval)
+            next_tick += interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Fell behind - resync instead of bursting
+    finally:
+        # Send the partial batch before exiting (the sender is a daemon thread)
+        enqueue_payload(send_queue, STOP_SENDER)
+        sender.join(timeout=SEND_SHUTDOWN_TIMEOUT_SECONDS)
 
 
 if __name__ == "__main__":
@@ -485,15 +784,44 @@ if __name__ == "__main__":
         help="Probability of recovery per cycle (0.0-1.0, default: 0.15)"
     )
 
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed the simulation RNG for reproducible degradation (default: random)"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Send this many cycles per request to /agent/metrics/batch (default: 1, no batching)"
+    )
+
+    parser.add_argument(
+        "--start-delay",
+        type=float,
+        default=0.0,
+        help="Seconds to wait before the first metrics cycle (default: 0)"
+    )
+
     args = parser.parse_args()
     
     # Configure degradation probabilities if custom values provided
     enable_realistic = not args.no_realistic
     
-    run_agent(
-        node_id=args.node_id,
-        backend_url=args.backend_url,
-        interval=args.interval,
-        enable_stress=args.demo_stress,
-        enable_realistic=enable_realistic
-    )
+    log_listener = configure_logging()
+    try:
+        run_agent(
+            node_id=args.node_id,
+            backend_url=args.backend_url,
+            interval=args.interval,
+            enable_stress=args.demo_stress,
+            enable_realistic=enable_realistic,
+            seed=args.seed,
+            batch_size=max(1, args.batch_size),
+            start_delay=max(0.0, args.start_delay)
+        )
+    finally:
+        # Flush any queued records before exiting
+        log_listener.stop()
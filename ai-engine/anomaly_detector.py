@@ -1,5 +1,61 @@
 from river import anomaly, preprocessing
 
+
+class FusedHalfSpaceTrees(anomaly.HalfSpaceTrees):
+    """
+    Half-Space Trees with a combined score + learn step.
+    Each tree is walked once per record instead of once for scoring and once for learning.
+    """
+
+    def reset(self):
+        """
+        Forget all learned mass but keep the trees.
+        Their structure only depends on the seed and feature names, so this matches a fresh instance.
+        """
+        for t in self.trees:
+            for node in t.iter_dfs():
+                node.l_mass = 0
+                node.r_mass = 0
+        self.counter = 0
+        self._first_window = True
+
+    def score_learn_one(self, x: dict) -> float:
+        """Score x against the reference window, then count it in the latest window"""
+        # Trees are built lazily on the first observation (score is 0 during the first window)
+        if not self.trees:
+            self.learn_one(x)
+            return 0
+
+        scoring = not self._first_window
+        size_limit = self.size_limit
+        score = 0.0
+
+        for t in self.trees:
+            counting = scoring
+            for depth, node in enumerate(t.walk(x)):
+                if counting:
+                    score += node.r_mass * 2**depth
+                    if node.r_mass < size_limit:
+                        counting = False
+                node.l_mass += 1
+
+        # Pivot the masses if necessary (same as HalfSpaceTrees.learn_one)
+        self.counter += 1
+        if self.counter == self.window_size:
+            for t in self.trees:
+                for node in t.iter_dfs():
+                    node.r_mass = node.l_mass
+                    node.l_mass = 0
+            self._first_window = False
+            self.counter = 0
+
+        if not scoring:
+            return 0
+
+        # High mass -> normal, so invert the normalized score
+        return 1 - score / self._max_score
+
+
 class StreamingAnomalyDetector:
     """
     Online anomaly detector using River's Half-Space Trees
@@ -7,13 +63,22 @@ class StreamingAnomalyDetector:
     """
 
     def __init__(self):
-        self.model = preprocessing.StandardScaler() | anomaly.HalfSpaceTrees(
+        self.scaler = preprocessing.StandardScaler()
+        self.trees = FusedHalfSpaceTrees(
             n_trees=25,
             height=10,
             window_size=250,
             seed=42
         )
 
+        # Feature container reused across calls (River only reads it)
+        self._features = {"cpu": 0.0, "memory": 0.0, "disk": 0.0}
+
+    def reset(self):
+        """Return to the untrained state (used when recycling detectors across nodes)"""
+        self.scaler = preprocessing.StandardScaler()
+        self.trees.reset()
+
     def process(self, metrics: dict) -> float:
         """
         Takes one metrics record and returns anomaly score.
@@ -21,14 +86,16 @@ class StreamingAnomalyDetector:
         """
 
         # FOCUSED: CPU gets high weight, network gets minimal weight
-        features = {
-            "cpu": metrics["cpu"]["usage_percent"] * 2.0,        # CPU is PRIMARY focus
-            "memory": metrics["memory"]["usage_percent"] * 1.2,  # Memory matters
-            "disk": metrics["disk"]["usage_percent"] * 0.8,      # Disk is stable
-            # Network excluded - fluctuations are normal and don't indicate problems
-        }
-
-        score = self.model.score_one(features)
-        self.model.learn_one(features)
+        features = self._features
+        features["cpu"] = metrics["cpu"]["usage_percent"] * 2.0        # CPU is PRIMARY focus
+        features["memory"] = metrics["memory"]["usage_percent"] * 1.2  # Memory matters
+        features["disk"] = metrics["disk"]["usage_percent"] * 0.8      # Disk is stable
+        # Network excluded - fluctuations are normal and don't indicate problems
+
+        # Scale with the pre-update statistics (as the scoring pass of a pipeline would),
+        # then score and learn in a single walk over the trees
+        scaled = self.scaler.transform_one(features)
+        score = self.trees.score_learn_one(scaled)
+        self.scaler.learn_one(features)
 
         return round(score, 4)
@@ -1,7 +1,13 @@
-from fastapi import FastAPI
+import asyncio
+import time
+import traceback
+from collections import OrderedDict, deque
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from metrics_collector import collect_system_metrics
 from anomaly_detector import StreamingAnomalyDetector
@@ -9,13 +15,14 @@ from health_evaluator import calculate_health
 from root_cause_analyzer import RootCauseAnalyzer
 from decision_agent import DecisionAgent
 from auto_healer import AutoHealer
-from explanation_engine import ExplanationEngine
+from explanation_engine import ExplanationEngine, ExplanationRequest, ExplanationResponse
 
 
 app = FastAPI(
     title="AI Ops System Health Engine",
     description="Agentic AIOps engine with autonomous decision-making, auto-healing, and explainable AI",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse  # Faster serialization of the large enriched payloads
 )
 
 # Enable CORS for frontend/backend communication
@@ -31,8 +38,51 @@ app.add_middleware(
 # MULTI-NODE STATE MANAGEMENT
 # ==========================================
 
-# Per-node streaming components: { node_id: { detector, analyzer } }
-node_processors = {}
+# Per-node streaming components: { node_id: { detector, analyzer, last_seen } }
+# Kept in least-recently-seen order, so eviction and idle sweeps start from the front
+node_processors: "OrderedDict[str, dict]" = OrderedDict()
+
+# Upper bound on tracked nodes (the least recently seen node is evicted beyond this)
+MAX_TRACKED_NODES = 10000
+
+# Nodes silent for this long hand their processors back to the pool
+PROCESSOR_IDLE_SECONDS = 300.0
+PROCESSOR_SWEEP_SECONDS = 60.0
+
+
+class ProcessorPool:
+    """
+    Recycles detector/analyzer pairs of nodes that went away.
+    Building a detector's trees is the costly part of a node's first report,
+    so released pairs are reset (keeping the trees) and handed to the next new node.
+    """
+
+    def __init__(self, max_free: int = 32):
+        self.max_free = max_free
+        self._free = []
+
+    def acquire(self) -> dict:
+        if self._free:
+            return self._free.pop()
+        return {
+            "detector": StreamingAnomalyDetector(),
+            "analyzer": RootCauseAnalyzer()
+        }
+
+    def release(self, processor: dict):
+        if len(self._free) < self.max_free:
+            processor["detector"].reset()
+            processor["analyzer"].reset()
+            self._free.append(processor)
+
+
+processor_pool = ProcessorPool()
+
+# How often timed-out healing verifications are closed for nodes that stopped reporting
+HEALING_SWEEP_SECONDS = 5.0
+
+# Periodic maintenance tasks started with the app
+background_tasks = []
 
 # Global DecisionAgent instance (maintains memory across all nodes)
 decision_agent = DecisionAgent(
@@ -65,40 +115,90 @@ explanation_engine = ExplanationEngine(
 @app.on_event("startup")
 async def startup_event():
     """Check Ollama availability and warm up model on startup"""
+    background_tasks.append(asyncio.create_task(processor_eviction_loop()))
+    background_tasks.append(asyncio.create_task(healing_verification_loop()))
+    
     available = await explanation_engine.check_availability()
     if available:
-        # Warm up the model by sending a simple request
-        # This loads the model into VRAM so subsequent requests are fast
-        print("[STARTUP] Warming up Ollama model (this may take a moment)...")
-        try:
-            warmup_result = explanation_engine.explain_decision(
-                decision="NO_ACTION",
-                root_cause="startup_warmup",
-                health_trend="STABLE",
-                persistence=0,
-                action_taken=None,
-                confidence=1.0,
-                contributing_factors=["warmup"]
-            )
-            print(f"[STARTUP] Ollama ready! (generated_by: {warmup_result['generated_by']})")
-        except Exception as e:
-            print(f"[STARTUP] Ollama warmup failed: {e} (will use fallback)")
+        # Loading the model can take up to a minute - do it in the background so the
+        # API serves right away (explanations fall back until the model is resident)
+        background_tasks.append(asyncio.create_task(warm_up_ollama()))
     else:
         print("[STARTUP] Ollama not available, using fallback explanations")
 
 
+async def warm_up_ollama():
+    """Load the Ollama model into memory ahead of the first real explanation"""
+    print("[STARTUP] Warming up Ollama model (this may take a moment)...")
+    if await explanation_engine.warmup():
+        print("[STARTUP] Ollama ready!")
+    else:
+        print("[STARTUP] Ollama warmup failed (will use fallback)")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the maintenance tasks and close the shared Ollama HTTP client"""
+    for task in background_tasks:
+        task.cancel()
+    await explanation_engine.aclose()
+
+
 def get_or_create_processor(node_id: str):
     """
     Get or create anomaly detector and root cause analyzer for a node.
     Each node has independent streaming state.
     DecisionAgent and AutoHealer are shared globally but maintain per-node memory.
     """
-    if node_id not in node_processors:
-        node_processors[node_id] = {
-            "detector": StreamingAnomalyDetector(),
-            "analyzer": RootCauseAnalyzer()
-        }
-    return node_processors[node_id]
+    processor = node_processors.get(node_id)
+    if processor is None:
+        if len(node_processors) >= MAX_TRACKED_NODES:
+            release_node(next(iter(node_processors)))
+        processor = node_processors[node_id] = processor_pool.acquire()
+    else:
+        node_processors.move_to_end(node_id)
+    processor["last_seen"] = time.monotonic()
+    return processor
+
+
+def release_node(node_id: str):
+    """Stop tracking a node: its processor goes back to the pool, its prediction trend restarts"""
+    processor_pool.release(node_processors.pop(node_id))
+    node_anomaly_history.pop(node_id, None)
+    last_explanations.pop(node_id, None)
+
+
+def release_idle_processors(now: float) -> int:
+    """Return processors of nodes idle for PROCESSOR_IDLE_SECONDS to the pool"""
+    released = 0
+    # Oldest first: stop at the first node that is still active
+    while node_processors:
+        node_id, processor = next(iter(node_processors.items()))
+        if now - processor["last_seen"] <= PROCESSOR_IDLE_SECONDS:
+            break
+        release_node(node_id)
+        released += 1
+    return released
+
+
+async def processor_eviction_loop():
+    """Periodically recycle processors of nodes that stopped reporting"""
+    while True:
+        await asyncio.sleep(PROCESSOR_SWEEP_SECONDS)
+        released = release_idle_processors(time.monotonic())
+        if released:
+            print(f"[NODES] Released {released} idle node processor(s) to the pool")
+
+
+async def healing_verification_loop():
+    """
+    Close healing verifications whose window expired without a new report.
+    Runs off the request path; results show up in /healing/status and /healing/history.
+    """
+    while True:
+        await asyncio.sleep(HEALING_SWEEP_SECONDS)
+        for action in auto_healer.expire_verifications():
+            print(f"[HEALING] {action.node_id}: {action.result}")
 
 
 # ==========================================
@@ -118,8 +218,14 @@ def health_check():
     return {"status": "AI Engine running", "version": "2.0.0", "multi_node": True}
 
 
+# Polls of /metrics arriving while a sample is being taken, or within this window
+# after it, share that sample (each sample also advances the local streaming state)
+LOCAL_METRICS_TTL_SECONDS = 0.5
+local_metrics_sample = {"task": None, "expires": 0.0}
+
+
 @app.get("/metrics")
-def get_system_metrics():
+async def get_system_metrics():
     """
     Returns real-time system metrics enriched with:
     - anomaly score
@@ -128,8 +234,26 @@ def get_system_metrics():
     - prediction (FIXED: was missing, causing infinite loading)
     (Legacy endpoint for single-node polling)
     """
+    task = local_metrics_sample["task"]
+    if task is None or (task.done() and time.monotonic() >= local_metrics_sample["expires"]):
+        task = local_metrics_sample["task"] = asyncio.ensure_future(sample_local_metrics())
+        task.add_done_callback(expire_local_metrics_sample)
+    # Shielded: a poller disconnecting must not cancel the sample others are waiting on
+    return await asyncio.shield(task)
+
+
+def expire_local_metrics_sample(task: asyncio.Future):
+    """Start the sharing window once a sample completes (failed samples are not shared)"""
+    if task.cancelled() or task.exception() is not None:
+        local_metrics_sample["task"] = None
+    else:
+        local_metrics_sample["expires"] = time.monotonic() + LOCAL_METRICS_TTL_SECONDS
 
-    # 1. Collect raw system metrics
+
+async def sample_local_metrics() -> dict:
+    """Collect and analyze one sample of this machine's metrics (the /metrics pipeline)"""
+
+    # 1. Collect raw system metrics (non-blocking: CPU is measured since the previous sample)
     metrics = collect_system_metrics()
 
     # 2. Streaming anomaly detection
@@ -154,16 +278,7 @@ def get_system_metrics():
     )
     
     # Build agent decision dict
-    agent_decision = {
-        "decision": agent_reasoning.decision,
-        "confidence": agent_reasoning.confidence,
-        "contributing_factors": agent_reasoning.contributing_factors,
-        "persistence": agent_reasoning.persistence,
-        "health_trend": agent_reasoning.health_trend,
-        "trend_velocity": agent_reasoning.trend_velocity,
-        "reasoning_chain": agent_reasoning.reasoning_chain,
-        "timestamp": agent_reasoning.timestamp
-    }
+    agent_decision = agent_reasoning.to_decision_dict()
     
     # Generate explanation - use FALLBACK for local polling (fast)
     # Ollama is used for /agent/metrics endpoint instead
@@ -198,7 +313,13 @@ def get_system_metrics():
 # MULTI-NODE AGENT ENDPOINT
 # ==========================================
 
+# Request models are validated by pydantic-core; unknown fields are dropped, and models are read-only
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class HeartbeatInfo(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     sequence: int = 0
     timestamp: Optional[str] = None
     uptime_seconds: float = 0
@@ -206,6 +327,8 @@ class HeartbeatInfo(BaseModel):
 
 class AgentStateInfo(BaseModel):
     """Agent internal health state (from PC agent)"""
+    model_config = REQUEST_MODEL_CONFIG
+
     health_state: str = "HEALTHY"  # HEALTHY, DEGRADING, DEGRADED, RECOVERING
     degradation_type: str = "NONE"  # NONE, CPU_PRESSURE, MEMORY_PRESSURE, NETWORK_SATURATION, COMBINED
     degradation_level: float = 0.0  # 0.0 to 1.0
@@ -215,6 +338,8 @@ class AgentStateInfo(BaseModel):
 
 
 class AgentMetricsRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     node_id: str
     metrics: Dict[str, Any]
     hostname: Optional[str] = None
@@ -224,8 +349,215 @@ class AgentMetricsRequest(BaseModel):
     target_severity: str = "NORMAL"
 
 
+def run_agent_pipeline(request: AgentMetricsRequest) -> Tuple[dict, ExplanationRequest]:
+    """
+    Run every stage of the agent pipeline except the LLM explanation for one report.
+    Returns the enriched response and the explanation request for its decision.
+    """
+    node_id = request.node_id
+    metrics = request.metrics
+    agent_state = request.agent_state
+    agent_state_dict = agent_state.model_dump() if agent_state else None  # Read-only downstream
+    
+    # Determine agent status from agent_state (if provided)
+    agent_status = "ACTIVE"
+    if agent_state:
+        if agent_state.health_state in ["DEGRADED", "DEGRADING"]:
+            agent_status = "DEGRADED"
+        elif agent_state.health_state == "RECOVERING":
+            agent_status = "RECOVERING"
+    
+    # Get or create processor for this node
+    processor = get_or_create_processor(node_id)
+    detector = processor["detector"]
+    analyzer = processor["analyzer"]
+    
+    # 1. Streaming anomaly detection (per-node)
+    anomaly_score = detector.process(metrics)
+    
+    # 2. Health score & risk level
+    system_health = calculate_health(anomaly_score)
+    
+    # 3. Root-cause analysis (per-node history)
+    analyzer.update(metrics)
+    root_cause = analyzer.analyze(metrics)
+    
+    # 4. AGENTIC AI DECISION ENGINE
+    # Agent perceives environment and makes autonomous decisions
+    # Now includes agent_state for REAL degradation awareness
+    agent_reasoning = decision_agent.perceive(
+        node_id=node_id,
+        health_score=system_health["health_score"],
+        anomaly_score=anomaly_score,
+        root_cause=root_cause.get("root_cause"),
+        incident_state=None,
+        agent_state=agent_state_dict,
+        metrics=metrics  # Pass raw metrics for CPU tracking
+    )
+    
+    # Convert agent reasoning to dictionary for JSON response
+    agent_decision = agent_reasoning.to_decision_dict()
+    
+    # 5. AUTO-HEALING (Task B)
+    # Process agent decision and execute safe healing actions
+    healing_actions = auto_healer.process_decision(
+        node_id=node_id,
+        agent_decision=agent_reasoning.decision,
+        health_score=system_health["health_score"],
+        anomaly_score=anomaly_score,
+        confidence=agent_reasoning.confidence
+    )
+    
+    # Get healing status for this node
+    healing_status = auto_healer.get_healing_status(node_id)
+    
+    # Convert healing actions to dicts
+    healing_actions_dicts = [
+        {
+            "action": a.action,
+            "action_type": a.action_type,
+            "result": a.result,
+            "confidence": a.confidence,
+            "verification_status": a.verification_status,
+            "timestamp": a.timestamp
+        }
+        for a in healing_actions
+    ]
+    
+    # 7. Context-aware prediction based on actual metrics and root cause
+    prediction = generate_prediction(node_id, anomaly_score, system_health, metrics, root_cause)
+    
+    # Structured input for the GenAI explanation (stage 6)
+    explanation_request = ExplanationRequest(
+        decision=agent_reasoning.decision,
+        root_cause=root_cause.get("root_cause"),
+        health_trend=agent_reasoning.health_trend,
+        persistence=agent_reasoning.persistence,
+        action_taken=healing_actions[0].action if healing_actions else None,
+        confidence=agent_reasoning.confidence,
+        contributing_factors=agent_reasoning.contributing_factors
+    )
+    
+    # 8. Build enriched response with full agentic intelligence
+    response = {
+        "node_id": node_id,
+        "timestamp": metrics.get("timestamp"),
+        "cpu": metrics.get("cpu"),
+        "memory": metrics.get("memory"),
+        "disk": metrics.get("disk"),
+        "network": metrics.get("network"),
+        "anomaly_score": anomaly_score,
+        "system_health": system_health,
+        "root_cause": root_cause,
+        "agent_decision": agent_decision,  # Autonomous decision + explanation
+        "healing_status": healing_status,  # Auto-healing state
+        "healing_actions": healing_actions_dicts,  # Actions taken
+        "prediction": prediction,
+        # Connection and agent status for multi-agent realism
+        "connection_state": "CONNECTED",  # Always CONNECTED when receiving metrics
+        "agent_status": agent_status,  # ACTIVE, DEGRADED, RECOVERING
+        "agent_state": agent_state_dict  # Full agent internal state
+    }
+    return response, explanation_request
+
+
+# Constant parts of the error fallback response (filled in per request by build_error_response)
+ERROR_RESPONSE_TEMPLATE: Dict[str, Any] = {
+    "node_id": None,
+    "timestamp": None,
+    "cpu": None,
+    "memory": None,
+    "disk": None,
+    "network": None,
+    "anomaly_score": 0.0,
+    "system_health": None,   # Nested values are built per response in build_error_response
+    "root_cause": None,
+    "agent_decision": None,
+    "healing_status": None,
+    "healing_actions": None,
+    "prediction": None,
+    "connection_state": "CONNECTED",
+    "agent_status": "ACTIVE",
+    "agent_state": None
+}
+ERROR_AGENT_DECISION: Dict[str, Any] = {
+    "decision": "NO_ACTION",
+    "confidence": 0.0,
+    "contributing_factors": None,  # Built per response, like the nested values above
+    "persistence": 0,
+    "health_trend": "STABLE",
+    "trend_velocity": 0.0,
+    "reasoning_chain": None,
+    "timestamp": 0,
+    "explanation": None,
+    "explanation_source": "error"
+}
+
+
+def build_error_response(request: AgentMetricsRequest, e: Exception) -> dict:
+    """Minimal valid response with error info, so the system keeps working"""
+    print(f"[ERROR] process_agent_metrics failed for {request.node_id}: {e}")
+    traceback.print_exc()
+
+    metrics = request.metrics or {}
+    error = str(e)
+    response = ERROR_RESPONSE_TEMPLATE.copy()
+    response["node_id"] = request.node_id
+    response["timestamp"] = metrics.get("timestamp")
+    response["cpu"] = metrics.get("cpu")
+    response["memory"] = metrics.get("memory")
+    response["disk"] = metrics.get("disk")
+    response["network"] = metrics.get("network")
+    response["system_health"] = {"health_score": 100.0, "risk_level": "NORMAL"}
+    response["root_cause"] = {"root_cause": "ERROR", "contributors": {}}
+    response["healing_actions"] = []
+    response["agent_decision"] = {
+        **ERROR_AGENT_DECISION,
+        "contributing_factors": ["processing_error"],
+        "reasoning_chain": [f"Error during processing: {error}"],
+        "explanation": f"Processing error: {error}"
+    }
+    response["prediction"] = {"status": "ERROR", "trend": "UNKNOWN", "risk_forecast": "UNKNOWN", "confidence": 0.0, "message": error}
+    return response
+
+
+# A node's last LLM explanation is reused while its decision is unchanged, up to this age
+EXPLANATION_REUSE_SECONDS = 30.0
+
+# { node_id: (generated_at, decision, explanation) }
+last_explanations: Dict[str, Tuple[float, str, str]] = {}
+
+
+def attach_explanation(response: dict, explanation: ExplanationResponse):
+    """Add a generated explanation to a pipeline response's agent decision"""
+    agent_decision = response["agent_decision"]
+    agent_decision["explanation"] = explanation.explanation
+    agent_decision["explanation_source"] = explanation.generated_by
+    if explanation.generated_by == "ollama":
+        last_explanations[response["node_id"]] = (
+            time.monotonic(), agent_decision["decision"], explanation.explanation
+        )
+
+
+def attach_reused_explanation(response: dict) -> bool:
+    """
+    Attach the node's previous LLM explanation if its decision hasn't changed since
+    (and it is recent). Returns False when a new explanation is needed.
+    """
+    agent_decision = response["agent_decision"]
+    previous = last_explanations.get(response["node_id"])
+    if previous is None:
+        return False
+    generated_at, decision, explanation = previous
+    if decision != agent_decision["decision"] or time.monotonic() - generated_at >= EXPLANATION_REUSE_SECONDS:
+        return False
+    agent_decision["explanation"] = explanation
+    agent_decision["explanation_source"] = "cache"
+    return True
+
+
 @app.post("/agent/metrics")
-def process_agent_metrics(request: AgentMetricsRequest):
+async def process_agent_metrics(request: AgentMetricsRequest):
     """
     Process metrics from a distributed agent.
     Each node_id has independent anomaly detection and root cause analysis.
@@ -249,160 +581,50 @@ def process_agent_metrics(request: AgentMetricsRequest):
     - prediction (future risk assessment)
     """
     try:
-        node_id = request.node_id
-        metrics = request.metrics
-        agent_state = request.agent_state
-        
-        # Determine agent status from agent_state (if provided)
-        agent_status = "ACTIVE"
-        if agent_state:
-            if agent_state.health_state in ["DEGRADED", "DEGRADING"]:
-                agent_status = "DEGRADED"
-            elif agent_state.health_state == "RECOVERING":
-                agent_status = "RECOVERING"
-        
-        # Get or create processor for this node
-        processor = get_or_create_processor(node_id)
-        detector = processor["detector"]
-        analyzer = processor["analyzer"]
-        
-        # 1. Streaming anomaly detection (per-node)
-        anomaly_score = detector.process(metrics)
-        
-        # 2. Health score & risk level
-        system_health = calculate_health(anomaly_score)
-        
-        # 3. Root-cause analysis (per-node history)
-        analyzer.update(metrics)
-        root_cause = analyzer.analyze(metrics)
-        
-        # 4. AGENTIC AI DECISION ENGINE
-        # Agent perceives environment and makes autonomous decisions
-        # Now includes agent_state for REAL degradation awareness
-        agent_reasoning = decision_agent.perceive(
-            node_id=node_id,
-            health_score=system_health["health_score"],
-            anomaly_score=anomaly_score,
-            root_cause=root_cause.get("root_cause"),
-            incident_state=None,
-            agent_state=agent_state.dict() if agent_state else None,
-            metrics=metrics  # Pass raw metrics for CPU tracking
-        )
-        
-        # Convert agent reasoning to dictionary for JSON response
-        agent_decision = {
-            "decision": agent_reasoning.decision,
-            "confidence": agent_reasoning.confidence,
-            "contributing_factors": agent_reasoning.contributing_factors,
-            "persistence": agent_reasoning.persistence,
-            "health_trend": agent_reasoning.health_trend,
-            "trend_velocity": agent_reasoning.trend_velocity,
-            "reasoning_chain": agent_reasoning.reasoning_chain,
-            "timestamp": agent_reasoning.timestamp
-        }
-        
-        # 5. AUTO-HEALING (Task B)
-        # Process agent decision and execute safe healing actions
-        healing_actions = auto_healer.process_decision(
-            node_id=node_id,
-            agent_decision=agent_reasoning.decision,
-            health_score=system_health["health_score"],
-            anomaly_score=anomaly_score,
-            confidence=agent_reasoning.confidence
-        )
-        
-        # Get healing status for this node
-        healing_status = auto_healer.get_healing_status(node_id)
-        
-        # Convert healing actions to dicts
-        healing_actions_dicts = [
-            {
-                "action": a.action,
-                "action_type": a.action_type,
-                "result": a.result,
-                "confidence": a.confidence,
-                "verification_status": a.verification_status,
-                "timestamp": a.timestamp
-            }
-            for a in healing_actions
-        ]
+        response, explanation_request = run_agent_pipeline(request)
         
         # 6. GENAI EXPLANATION (Task C)
         # Generate human-readable explanation of agent decision
-        # LLM only explains - NEVER decides
-        explanation_result = explanation_engine.explain_decision(
-            decision=agent_reasoning.decision,
-            root_cause=root_cause.get("root_cause"),
-            health_trend=agent_reasoning.health_trend,
-            persistence=agent_reasoning.persistence,
-            action_taken=healing_actions[0].action if healing_actions else None,
-            confidence=agent_reasoning.confidence,
-            contributing_factors=agent_reasoning.contributing_factors
-        )
-        
-        # Add explanation to agent decision
-        agent_decision["explanation"] = explanation_result["explanation"]
-        agent_decision["explanation_source"] = explanation_result["generated_by"]
-        
-        # 7. Context-aware prediction based on actual metrics and root cause
-        prediction = generate_prediction(node_id, anomaly_score, system_health, metrics, root_cause)
-        
-        # 8. Build enriched response with full agentic intelligence
-        return {
-            "node_id": node_id,
-            "timestamp": metrics.get("timestamp"),
-            "cpu": metrics.get("cpu"),
-            "memory": metrics.get("memory"),
-            "disk": metrics.get("disk"),
-            "network": metrics.get("network"),
-            "anomaly_score": anomaly_score,
-            "system_health": system_health,
-            "root_cause": root_cause,
-            "agent_decision": agent_decision,  # Autonomous decision + explanation
-            "healing_status": healing_status,  # Auto-healing state
-            "healing_actions": healing_actions_dicts,  # Actions taken
-            "prediction": prediction,
-            # Connection and agent status for multi-agent realism
-            "connection_state": "CONNECTED",  # Always CONNECTED when receiving metrics
-            "agent_status": agent_status,  # ACTIVE, DEGRADED, RECOVERING
-            "agent_state": agent_state.dict() if agent_state else None  # Full agent internal state
-        }
+        # LLM only explains - NEVER decides (and is skipped while the decision is unchanged)
+        if not attach_reused_explanation(response):
+            attach_explanation(response, await explanation_engine.explain_async(explanation_request))
+        return response
     except Exception as e:
-        # Log error but return a valid response so the system keeps working
-        import traceback
-        print(f"[ERROR] process_agent_metrics failed for {request.node_id}: {e}")
-        traceback.print_exc()
-        
-        # Return minimal valid response with error info
-        return {
-            "node_id": request.node_id,
-            "timestamp": request.metrics.get("timestamp") if request.metrics else None,
-            "cpu": request.metrics.get("cpu") if request.metrics else None,
-            "memory": request.metrics.get("memory") if request.metrics else None,
-            "disk": request.metrics.get("disk") if request.metrics else None,
-            "network": request.metrics.get("network") if request.metrics else None,
-            "anomaly_score": 0.0,
-            "system_health": {"health_score": 100.0, "risk_level": "NORMAL"},
-            "root_cause": {"root_cause": "ERROR", "contributors": {}},
-            "agent_decision": {
-                "decision": "NO_ACTION",
-                "confidence": 0.0,
-                "contributing_factors": ["processing_error"],
-                "persistence": 0,
-                "health_trend": "STABLE",
-                "trend_velocity": 0.0,
-                "reasoning_chain": [f"Error during processing: {str(e)}"],
-                "timestamp": 0,
-                "explanation": f"Processing error: {str(e)}",
-                "explanation_source": "error"
-            },
-            "healing_status": None,
-            "healing_actions": [],
-            "prediction": {"status": "ERROR", "trend": "UNKNOWN", "risk_forecast": "UNKNOWN", "confidence": 0.0, "message": str(e)},
-            "connection_state": "CONNECTED",
-            "agent_status": "ACTIVE",
-            "agent_state": None
-        }
+        return build_error_response(request, e)
+
+
+class AgentMetricsBatchRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
+    items: List[AgentMetricsRequest]
+
+
+@app.post("/agent/metrics/batch")
+async def process_agent_metrics_batch(request: AgentMetricsBatchRequest):
+    """
+    Process several metrics reports in one call (e.g. a backlog of cycles, or many nodes).
+    Items run through the pipeline in order, then all their explanations
+    are generated with a single Ollama request.
+    
+    Returns {"results": [...]} with one /agent/metrics-style response per item.
+    """
+    results = []
+    pending = []  # (response, explanation request) awaiting an explanation
+    for item in request.items:
+        try:
+            response, explanation_request = run_agent_pipeline(item)
+            if not attach_reused_explanation(response):
+                pending.append((response, explanation_request))
+        except Exception as e:
+            response = build_error_response(item, e)
+        results.append(response)
+    
+    if pending:
+        explanations = await explanation_engine.explain_batch([req for _, req in pending])
+        for (response, _), explanation in zip(pending, explanations):
+            attach_explanation(response, explanation)
+    
+    return {"results": results}
 
 
 # ==========================================
@@ -413,6 +635,68 @@ def process_agent_metrics(request: AgentMetricsRequest):
 node_anomaly_history = {}
 HISTORY_SIZE = 10
 
+# Prediction message templates: (trend, risk_level, primary_cause) ->
+#   fn(cpu, mem, disk, cause, trend_delta) -> (risk_forecast, message, eta_minutes)
+# ANY matches every risk level / cause not listed explicitly
+ANY = "*"
+PREDICTION_MESSAGES = {
+    # Degrading + critical: context-aware critical messages
+    ("DEGRADING", "CRITICAL", "CPU"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"⚠️ CPU critical at {cpu:.1f}% - process overload likely", max(2, int(15 / (td * 10 + 0.2)))),
+    ("DEGRADING", "CRITICAL", "MEMORY"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"⚠️ Memory critical at {mem:.1f}% - risk of OOM", max(2, int(15 / (td * 10 + 0.2)))),
+    ("DEGRADING", "CRITICAL", "DISK"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"⚠️ Disk critical at {disk:.1f}% - storage exhaustion imminent", max(2, int(15 / (td * 10 + 0.2)))),
+    ("DEGRADING", "CRITICAL", ANY): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"⚠️ System critical - {cause} is primary factor", max(2, int(15 / (td * 10 + 0.2)))),
+    # Degrading + warning: context-aware warning messages
+    ("DEGRADING", "WARNING", "CPU"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"CPU elevated at {cpu:.1f}% - may escalate to critical", max(5, int(25 / (td * 10 + 0.1)))),
+    ("DEGRADING", "WARNING", "MEMORY"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"Memory pressure at {mem:.1f}% - monitor for leaks", max(5, int(25 / (td * 10 + 0.1)))),
+    ("DEGRADING", "WARNING", "DISK"): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"Disk usage at {disk:.1f}% - consider cleanup", max(5, int(25 / (td * 10 + 0.1)))),
+    ("DEGRADING", "WARNING", ANY): lambda cpu, mem, disk, cause, td: (
+        "HIGH", f"Degradation detected - {cause} trending up", max(5, int(25 / (td * 10 + 0.1)))),
+    ("DEGRADING", ANY, ANY): lambda cpu, mem, disk, cause, td: (
+        "MEDIUM", f"Minor anomaly detected in {cause.lower()}", max(10, int(40 / (td * 10 + 0.1)))),
+    # Improving: context-aware recovery message
+    ("IMPROVING", ANY, ANY): lambda cpu, mem, disk, cause, td: (
+        "LOW",
+        f"✓ Recovered - CPU {cpu:.1f}%, Memory {mem:.1f}%" if cpu < 30 and mem < 50
+        else f"✓ Improving - {cause} returning to normal",
+        None),
+    # Stable: elevated, or show actual healthy stats
+    ("STABLE", "WARNING", ANY): lambda cpu, mem, disk, cause, td: (
+        "MEDIUM", f"Stable but elevated - {cause} at moderate levels", None),
+    ("STABLE", ANY, ANY): lambda cpu, mem, disk, cause, td: (
+        "LOW", f"✓ Healthy - CPU {cpu:.1f}%, Mem {mem:.1f}%, Disk {disk:.1f}%", None),
+}
+
+
+def usage_percentages(metrics: Optional[dict]) -> Tuple[float, float, float]:
+    """(cpu, memory, disk) usage percent from a metrics record, 0 where missing"""
+    if not metrics:
+        return 0, 0, 0
+    cpu = metrics.get("cpu") or {}
+    memory = metrics.get("memory") or {}
+    disk = metrics.get("disk") or {}
+    return cpu.get("usage_percent", 0), memory.get("usage_percent", 0), disk.get("usage_percent", 0)
+
+
+def trend_statistics(history: List[float]) -> Tuple[float, float]:
+    """
+    (trend_delta, variance) of an anomaly score history (needs >= 2 scores):
+    mean of the last 5 scores vs. the ones before them, and the variance of the last 5
+    """
+    n_recent = min(5, len(history))
+    recent = history[-n_recent:]
+    older = history[:-n_recent]
+    avg_recent = sum(recent) / n_recent
+    avg_older = sum(older) / len(older) if older else avg_recent
+    variance = sum([(x - avg_recent) ** 2 for x in recent]) / n_recent
+    return avg_recent - avg_older, variance
+
 
 def generate_prediction(node_id: str, current_score: float, health: dict, metrics: dict = None, root_cause: dict = None) -> dict:
     """
@@ -423,16 +707,12 @@ def generate_prediction(node_id: str, current_score: float, health: dict, metric
     - Root cause analysis
     ALWAYS returns a valid status to prevent infinite loading in frontend.
     """
-    # Initialize history for new nodes
+    # Initialize history for new nodes (bounded: oldest score drops off automatically)
     if node_id not in node_anomaly_history:
-        node_anomaly_history[node_id] = []
+        node_anomaly_history[node_id] = deque(maxlen=HISTORY_SIZE)
     
-    history = node_anomaly_history[node_id]
-    history.append(current_score)
-    
-    # Keep only recent history
-    if len(history) > HISTORY_SIZE:
-        history.pop(0)
+    node_anomaly_history[node_id].append(current_score)
+    history = list(node_anomaly_history[node_id])  # Snapshot for slicing below
     
     # Only need 2 data points for prediction
     if len(history) < 2:
@@ -445,79 +725,38 @@ def generate_prediction(node_id: str, current_score: float, health: dict, metric
         }
     
     # Extract actual metric values for context-aware messages
-    cpu_usage = metrics.get("cpu", {}).get("usage_percent", 0) if metrics else 0
-    mem_usage = metrics.get("memory", {}).get("usage_percent", 0) if metrics else 0
-    disk_usage = metrics.get("disk", {}).get("usage_percent", 0) if metrics else 0
+    cpu_usage, mem_usage, disk_usage = usage_percentages(metrics)
     primary_cause = root_cause.get("root_cause", "UNKNOWN") if root_cause else "UNKNOWN"
     
     # Calculate trend from available history
-    recent = history[-5:] if len(history) >= 5 else history
-    avg_recent = sum(recent) / len(recent)
-    avg_older = sum(history[:-len(recent)]) / max(1, len(history[:-len(recent)])) if len(history) > len(recent) else avg_recent
-    
-    trend_delta = avg_recent - avg_older
+    trend_delta, variance = trend_statistics(history)
     
     # Factor in current health state for immediate responsiveness
     if current_score > 0.5:
         trend_delta += (current_score - 0.3) * 0.5
     
     # Generate CONTEXT-AWARE prediction messages based on actual metrics
-    if trend_delta > 0.03 or health["risk_level"] == "CRITICAL":
+    risk_level = health["risk_level"]
+    if trend_delta > 0.03 or risk_level == "CRITICAL":
         trend = "DEGRADING"
-        if health["risk_level"] == "CRITICAL":
-            risk_forecast = "HIGH"
-            # Context-aware critical message
-            if primary_cause == "CPU":
-                message = f"⚠️ CPU critical at {cpu_usage:.1f}% - process overload likely"
-            elif primary_cause == "MEMORY":
-                message = f"⚠️ Memory critical at {mem_usage:.1f}% - risk of OOM"
-            elif primary_cause == "DISK":
-                message = f"⚠️ Disk critical at {disk_usage:.1f}% - storage exhaustion imminent"
-            else:
-                message = f"⚠️ System critical - {primary_cause} is primary factor"
-            eta_minutes = max(2, int(15 / (trend_delta * 10 + 0.2)))
-        elif health["risk_level"] == "WARNING":
-            risk_forecast = "HIGH"
-            # Context-aware warning message
-            if primary_cause == "CPU":
-                message = f"CPU elevated at {cpu_usage:.1f}% - may escalate to critical"
-            elif primary_cause == "MEMORY":
-                message = f"Memory pressure at {mem_usage:.1f}% - monitor for leaks"
-            elif primary_cause == "DISK":
-                message = f"Disk usage at {disk_usage:.1f}% - consider cleanup"
-            else:
-                message = f"Degradation detected - {primary_cause} trending up"
-            eta_minutes = max(5, int(25 / (trend_delta * 10 + 0.1)))
-        else:
-            risk_forecast = "MEDIUM"
-            message = f"Minor anomaly detected in {primary_cause.lower()}"
-            eta_minutes = max(10, int(40 / (trend_delta * 10 + 0.1)))
         status = "FAILURE_LIKELY"
     elif trend_delta < -0.03:
         trend = "IMPROVING"
-        risk_forecast = "LOW"
-        # Context-aware recovery message
-        if cpu_usage < 30 and mem_usage < 50:
-            message = f"✓ Recovered - CPU {cpu_usage:.1f}%, Memory {mem_usage:.1f}%"
-        else:
-            message = f"✓ Improving - {primary_cause} returning to normal"
         status = "STABLE"
-        eta_minutes = None
     else:
         trend = "STABLE"
-        if health["risk_level"] == "WARNING":
-            risk_forecast = "MEDIUM"
-            message = f"Stable but elevated - {primary_cause} at moderate levels"
-        else:
-            risk_forecast = "LOW"
-            # Show actual healthy stats
-            message = f"✓ Healthy - CPU {cpu_usage:.1f}%, Mem {mem_usage:.1f}%, Disk {disk_usage:.1f}%"
         status = "STABLE"
-        eta_minutes = None
+    
+    # Most specific template wins: exact cause, then any cause, then any risk level
+    build_message = (
+        PREDICTION_MESSAGES.get((trend, risk_level, primary_cause))
+        or PREDICTION_MESSAGES.get((trend, risk_level, ANY))
+        or PREDICTION_MESSAGES[(trend, ANY, ANY)]
+    )
+    risk_forecast, message, eta_minutes = build_message(cpu_usage, mem_usage, disk_usage, primary_cause, trend_delta)
     
     # Confidence based on data points and consistency
     data_confidence = min(1.0, len(history) / HISTORY_SIZE)  # More data = more confidence
-    variance = sum((x - avg_recent) ** 2 for x in recent) / len(recent)
     consistency_confidence = max(0.3, 1.0 - variance)
     confidence = min(0.95, data_confidence * 0.4 + consistency_confidence * 0.6)  # Capped at 95%
     
@@ -536,31 +775,48 @@ def generate_prediction(node_id: str, current_score: float, health: dict, metric
     return result
 
 
+# Endpoints reading node, agent or healer state are async on purpose: they run on the
+# event loop, the same thread that updates that state, so they never see it mid-update
+# and need no locks (plain def endpoints would run concurrently in the threadpool)
+
 @app.get("/nodes")
-def get_active_nodes():
+async def get_active_nodes():
     """
     Returns list of nodes that have sent metrics to the AI Engine
     """
     return {
-        "nodes": list(node_processors.keys()),
+        "nodes": list(node_processors),
         "count": len(node_processors)
     }
 
 
+def conditional_response(request: Request, etag: str, build_body) -> Response:
+    """
+    Answer with 304 Not Modified when the client's If-None-Match already names this
+    version; otherwise build and serialize the body, tagged with the ETag
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(build_body(), headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
 @app.get("/agent/decisions")
-def get_agent_decisions(limit: int = 10):
+async def get_agent_decisions(request: Request, limit: int = 10):
     """
     Get recent agent decisions across all nodes
     Shows the agent's autonomous decision history
     """
-    return {
+    total_nodes = len(decision_agent.node_memories)
+    etag = f'W/"{decision_agent.history_version}-{total_nodes}-{limit}"'
+    return conditional_response(request, etag, lambda: {
         "decisions": decision_agent.get_decision_history(limit=limit),
-        "total_nodes": len(decision_agent.node_memories)
-    }
+        "total_nodes": total_nodes
+    })
 
 
 @app.get("/agent/memory/{node_id}")
-def get_agent_memory(node_id: str):
+async def get_agent_memory(node_id: str):
     """
     Get current agent memory state for a specific node
     Useful for debugging and understanding agent's internal state
@@ -576,7 +832,7 @@ def get_agent_memory(node_id: str):
 # ==========================================
 
 @app.get("/healing/status/{node_id}")
-def get_healing_status(node_id: str):
+async def get_healing_status(node_id: str):
     """
     Get current healing status for a specific node
     """
@@ -584,18 +840,20 @@ def get_healing_status(node_id: str):
 
 
 @app.get("/healing/history")
-def get_healing_history(limit: int = 20):
+async def get_healing_history(request: Request, limit: int = 20):
     """
     Get recent healing actions across all nodes
     """
-    return {
+    total_nodes = len(auto_healer.healing_memories)
+    etag = f'W/"{auto_healer.history_version}-{total_nodes}-{limit}"'
+    return conditional_response(request, etag, lambda: {
         "actions": auto_healer.get_healing_history(limit=limit),
-        "total_nodes": len(auto_healer.healing_memories)
-    }
+        "total_nodes": total_nodes
+    })
 
 
 @app.get("/healing/monitoring/{node_id}")
-def get_monitoring_interval(node_id: str):
+async def get_monitoring_interval(node_id: str):
     """
     Get current adaptive monitoring interval for a node
     """
@@ -619,7 +877,7 @@ def get_explanation_status():
 
 
 @app.post("/explanation/generate")
-def generate_explanation(
+async def generate_explanation(
     decision: str,
     health_trend: str,
     persistence: int,
@@ -629,8 +887,9 @@ def generate_explanation(
 ):
     """
     Generate an explanation for a decision (for testing)
+    Async: the Ollama call awaits the shared client instead of holding a threadpool worker
     """
-    return explanation_engine.explain_decision(
+    return await explanation_engine.explain_decision_async(
         decision=decision,
         root_cause=root_cause,
         health_trend=health_trend,
@@ -18,11 +18,12 @@ Healing Capabilities:
 This module provides DEFENSIBLE auto-healing for demos and vivas.
 """
 
+import heapq
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from collections import deque
+from collections import OrderedDict, deque
 
 
 class HealingActionType(Enum):
@@ -44,7 +45,14 @@ class VerificationStatus(Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+# Plain-string statuses for building actions: Enum .value is a descriptor call
+# (~10x slower than a global lookup) and every decision records several actions
+STATUS_PENDING = VerificationStatus.PENDING.value
+STATUS_SUCCESS = VerificationStatus.SUCCESS.value
+STATUS_FAILED = VerificationStatus.FAILED.value
+
+
+@dataclass(slots=True)
 class HealingAction:
     """Structured output for every healing action"""
     node_id: str
@@ -55,9 +63,22 @@ class HealingAction:
     verification_status: str
     timestamp: float
     details: Dict
+    
+    def to_dict(self) -> Dict:
+        """Same as dataclasses.asdict, without its recursive deepcopy (details hold only scalars)"""
+        return {
+            "node_id": self.node_id,
+            "action": self.action,
+            "action_type": self.action_type,
+            "result": self.result,
+            "confidence": self.confidence,
+            "verification_status": self.verification_status,
+            "timestamp": self.timestamp,
+            "details": dict(self.details)
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveMonitoringState:
     """Tracks sampling rate adjustments per node"""
     node_id: str
@@ -67,7 +88,7 @@ class AdaptiveMonitoringState:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HealingMemory:
     """Memory state for healing per node"""
     node_id: str
@@ -79,6 +100,7 @@ class HealingMemory:
     pre_healing_health: Optional[float]
     post_healing_health: Optional[float]
     consecutive_failures: int
+    last_report_time: Optional[float]  # When process_decision last ran for the node
 
 
 class AutoHealer:
@@ -101,7 +123,8 @@ class AutoHealer:
         min_sampling_interval: float = 1.0,
         max_sampling_interval: float = 15.0,
         verification_window_seconds: float = 30.0,
-        max_healing_attempts: int = 3
+        max_healing_attempts: int = 3,
+        max_nodes: int = 10000
     ):
         """
         Initialize the auto-healer with safety constraints
@@ -112,54 +135,92 @@ class AutoHealer:
             max_sampling_interval: Slowest sampling when stable
             verification_window_seconds: Time to verify healing
             max_healing_attempts: Max attempts before escalating
+            max_nodes: Most nodes with healing state kept (least recently used are cleared)
         """
         self.base_sampling_interval = base_sampling_interval
         self.min_sampling_interval = min_sampling_interval
         self.max_sampling_interval = max_sampling_interval
         self.verification_window_seconds = verification_window_seconds
         self.max_healing_attempts = max_healing_attempts
+        self.max_nodes = max_nodes
         
-        # Per-node healing memory
-        self.healing_memories: Dict[str, HealingMemory] = {}
+        # Per-node healing memory (LRU order: least recently used first)
+        self.healing_memories: "OrderedDict[str, HealingMemory]" = OrderedDict()
         
-        # Per-node adaptive monitoring state
-        self.monitoring_states: Dict[str, AdaptiveMonitoringState] = {}
+        # Per-node adaptive monitoring state (LRU order)
+        self.monitoring_states: "OrderedDict[str, AdaptiveMonitoringState]" = OrderedDict()
         
         # Global healing history for audit
         self.healing_history: deque = deque(maxlen=100)
+        # Bumped on every recorded action (lets the API answer unchanged polls with 304s)
+        self.history_version = 0
+        
+        # Min-heap of (verification_deadline, node_id) for the expiry sweep; entries whose
+        # verification already finished or was re-armed are skipped when popped
+        self.verification_deadlines: List[Tuple[float, str]] = []
         
         # Simulated health modifiers (for demo purposes)
         # These DON'T modify actual system - only the reported metrics
         self.health_modifiers: Dict[str, float] = {}
         self.anomaly_modifiers: Dict[str, float] = {}
+        
+        # Decision -> policy; every handler takes
+        # (actions, node_id, health_score, anomaly_score, confidence, memory, timestamp)
+        # and appends what it did to actions
+        self._decision_handlers = {
+            "AUTO_HEAL": self._execute_auto_heal,
+            "ESCALATE": self._execute_escalation_response,
+            "PREDICT_FAILURE": self._execute_failure_prevention,
+            "DE_ESCALATE": self._execute_de_escalation,
+            "NO_ACTION": self._execute_stable_maintenance
+        }
+    
+    def _new_memory(self, node_id: str) -> HealingMemory:
+        """Initial healing memory for a node"""
+        return HealingMemory(
+            node_id=node_id,
+            healing_attempts=deque(maxlen=10),
+            last_healing_time=None,
+            active_healing=False,
+            verification_pending=False,
+            verification_deadline=None,
+            pre_healing_health=None,
+            post_healing_health=None,
+            consecutive_failures=0,
+            last_report_time=None
+        )
+    
+    def _new_monitoring_state(self, node_id: str) -> AdaptiveMonitoringState:
+        """Initial monitoring state for a node"""
+        return AdaptiveMonitoringState(
+            node_id=node_id,
+            base_interval_seconds=self.base_sampling_interval,
+            current_interval_seconds=self.base_sampling_interval,
+            last_adjustment_time=time.time(),
+            reason="initialized"
+        )
     
     def _get_or_create_memory(self, node_id: str) -> HealingMemory:
         """Get or create healing memory for a node"""
-        if node_id not in self.healing_memories:
-            self.healing_memories[node_id] = HealingMemory(
-                node_id=node_id,
-                healing_attempts=deque(maxlen=10),
-                last_healing_time=None,
-                active_healing=False,
-                verification_pending=False,
-                verification_deadline=None,
-                pre_healing_health=None,
-                post_healing_health=None,
-                consecutive_failures=0
-            )
-        return self.healing_memories[node_id]
+        memory = self.healing_memories.get(node_id)
+        if memory is not None:
+            self.healing_memories.move_to_end(node_id)
+            return memory
+        if len(self.healing_memories) >= self.max_nodes:
+            self.clear_node_state(next(iter(self.healing_memories)))
+        memory = self.healing_memories[node_id] = self._new_memory(node_id)
+        return memory
     
     def _get_or_create_monitoring_state(self, node_id: str) -> AdaptiveMonitoringState:
         """Get or create monitoring state for a node"""
-        if node_id not in self.monitoring_states:
-            self.monitoring_states[node_id] = AdaptiveMonitoringState(
-                node_id=node_id,
-                base_interval_seconds=self.base_sampling_interval,
-                current_interval_seconds=self.base_sampling_interval,
-                last_adjustment_time=time.time(),
-                reason="initialized"
-            )
-        return self.monitoring_states[node_id]
+        state = self.monitoring_states.get(node_id)
+        if state is not None:
+            self.monitoring_states.move_to_end(node_id)
+            return state
+        if len(self.monitoring_states) >= self.max_nodes:
+            self.clear_node_state(next(iter(self.monitoring_states)))
+        state = self.monitoring_states[node_id] = self._new_monitoring_state(node_id)
+        return state
     
     def process_decision(
         self,
@@ -185,52 +246,36 @@ class AutoHealer:
         actions = []
         timestamp = time.time()
         memory = self._get_or_create_memory(node_id)
+        memory.last_report_time = timestamp
         
         # First, check if we have pending verification
         if memory.verification_pending:
-            verification_action = self._verify_healing(node_id, health_score)
+            verification_action = self._verify_healing(node_id, health_score, memory, timestamp)
             actions.append(verification_action)
         
-        # Process based on decision type
-        if agent_decision == "AUTO_HEAL":
-            actions.extend(self._execute_auto_heal(
-                node_id, health_score, anomaly_score, confidence
-            ))
-            
-        elif agent_decision == "ESCALATE":
-            actions.extend(self._execute_escalation_response(
-                node_id, health_score, anomaly_score
-            ))
-            
-        elif agent_decision == "PREDICT_FAILURE":
-            actions.extend(self._execute_failure_prevention(
-                node_id, health_score, anomaly_score
-            ))
-            
-        elif agent_decision == "DE_ESCALATE":
-            actions.extend(self._execute_de_escalation(
-                node_id, health_score, anomaly_score
-            ))
-            
-        elif agent_decision == "NO_ACTION":
-            actions.extend(self._execute_stable_maintenance(
-                node_id, health_score, anomaly_score
-            ))
+        # Process based on decision type (unknown decisions take no action)
+        handler = self._decision_handlers.get(agent_decision)
+        if handler is not None:
+            handler(actions, node_id, health_score, anomaly_score, confidence, memory, timestamp)
         
         # Record all actions in history
         for action in actions:
             self.healing_history.append(action)
             memory.healing_attempts.append(action)
+        self.history_version += len(actions)
         
         return actions
     
     def _execute_auto_heal(
         self,
+        actions: List[HealingAction],
         node_id: str,
         health_score: float,
         anomaly_score: float,
-        confidence: float
-    ) -> List[HealingAction]:
+        confidence: float,
+        memory: HealingMemory,
+        timestamp: float
+    ):
         """
         Execute AUTO_HEAL decision
         
@@ -240,10 +285,6 @@ class AutoHealer:
         3. Apply simulated anomaly decay
         4. Set up verification
         """
-        actions = []
-        timestamp = time.time()
-        memory = self._get_or_create_memory(node_id)
-        
         # Check if we've exceeded max attempts
         if memory.consecutive_failures >= self.max_healing_attempts:
             actions.append(HealingAction(
@@ -252,22 +293,24 @@ class AutoHealer:
                 action_type="REAL",
                 result=f"Max healing attempts ({self.max_healing_attempts}) exceeded",
                 confidence=0.95,
-                verification_status=VerificationStatus.FAILED.value,
+                verification_status=STATUS_FAILED,
                 timestamp=timestamp,
                 details={
                     "consecutive_failures": memory.consecutive_failures,
                     "recommendation": "Manual intervention required"
                 }
             ))
-            return actions
+            return
         
         # Action 1: Adaptive monitoring - increase frequency
         monitoring_action = self._adjust_monitoring(
             node_id, 
             HealingActionType.ADAPTIVE_MONITORING_INCREASE,
-            "auto_heal_triggered"
+            "auto_heal_triggered",
+            timestamp
         )
-        actions.append(monitoring_action)
+        if monitoring_action is not None:
+            actions.append(monitoring_action)
         
         # Action 2: Simulated health boost (MARKED AS SIMULATED)
         health_boost = min(10.0, (100 - health_score) * 0.15)  # 15% of deficit
@@ -279,7 +322,7 @@ class AutoHealer:
             action_type="SIMULATED",  # Clearly marked
             result=f"Applied simulated health boost of {health_boost:.1f} points",
             confidence=confidence,
-            verification_status=VerificationStatus.PENDING.value,
+            verification_status=STATUS_PENDING,
             timestamp=timestamp,
             details={
                 "boost_amount": health_boost,
@@ -299,7 +342,7 @@ class AutoHealer:
             action_type="SIMULATED",
             result=f"Applied simulated anomaly decay of {anomaly_decay:.2f}",
             confidence=confidence,
-            verification_status=VerificationStatus.PENDING.value,
+            verification_status=STATUS_PENDING,
             timestamp=timestamp,
             details={
                 "decay_amount": anomaly_decay,
@@ -313,17 +356,20 @@ class AutoHealer:
         memory.active_healing = True
         memory.verification_pending = True
         memory.verification_deadline = timestamp + self.verification_window_seconds
+        heapq.heappush(self.verification_deadlines, (memory.verification_deadline, node_id))
         memory.pre_healing_health = health_score
         memory.last_healing_time = timestamp
-        
-        return actions
     
     def _execute_escalation_response(
         self,
+        actions: List[HealingAction],
         node_id: str,
         health_score: float,
-        anomaly_score: float
-    ) -> List[HealingAction]:
+        anomaly_score: float,
+        confidence: float,
+        memory: HealingMemory,
+        timestamp: float
+    ):
         """
         Respond to ESCALATE decision
         
@@ -331,16 +377,15 @@ class AutoHealer:
         1. Increase monitoring frequency significantly
         2. Log escalation for visibility
         """
-        actions = []
-        timestamp = time.time()
-        
         # Aggressive monitoring increase
         monitoring_action = self._adjust_monitoring(
             node_id,
             HealingActionType.ADAPTIVE_MONITORING_INCREASE,
-            "escalation_detected"
+            "escalation_detected",
+            timestamp
         )
-        actions.append(monitoring_action)
+        if monitoring_action is not None:
+            actions.append(monitoring_action)
         
         actions.append(HealingAction(
             node_id=node_id,
@@ -348,7 +393,7 @@ class AutoHealer:
             action_type="REAL",
             result="System under close observation due to escalation",
             confidence=0.85,
-            verification_status=VerificationStatus.PENDING.value,
+            verification_status=STATUS_PENDING,
             timestamp=timestamp,
             details={
                 "health_score": health_score,
@@ -356,15 +401,17 @@ class AutoHealer:
                 "action": "Increased monitoring frequency, awaiting stabilization"
             }
         ))
-        
-        return actions
     
     def _execute_failure_prevention(
         self,
+        actions: List[HealingAction],
         node_id: str,
         health_score: float,
-        anomaly_score: float
-    ) -> List[HealingAction]:
+        anomaly_score: float,
+        confidence: float,
+        memory: HealingMemory,
+        timestamp: float
+    ):
         """
         Respond to PREDICT_FAILURE decision
         
@@ -373,9 +420,6 @@ class AutoHealer:
         2. Log critical state
         3. Prepare for incident auto-resolution when recovery detected
         """
-        actions = []
-        timestamp = time.time()
-        
         # Maximum monitoring frequency
         state = self._get_or_create_monitoring_state(node_id)
         state.current_interval_seconds = self.min_sampling_interval
@@ -388,7 +432,7 @@ class AutoHealer:
             action_type="REAL",
             result=f"Maximum monitoring activated (interval: {self.min_sampling_interval}s)",
             confidence=0.95,
-            verification_status=VerificationStatus.PENDING.value,
+            verification_status=STATUS_PENDING,
             timestamp=timestamp,
             details={
                 "health_score": health_score,
@@ -398,15 +442,17 @@ class AutoHealer:
                 "note": "System at risk - intensive monitoring enabled"
             }
         ))
-        
-        return actions
     
     def _execute_de_escalation(
         self,
+        actions: List[HealingAction],
         node_id: str,
         health_score: float,
-        anomaly_score: float
-    ) -> List[HealingAction]:
+        anomaly_score: float,
+        confidence: float,
+        memory: HealingMemory,
+        timestamp: float
+    ):
         """
         Respond to DE_ESCALATE decision
         
@@ -415,23 +461,19 @@ class AutoHealer:
         2. Consider incident auto-resolution
         3. Clear simulated modifiers
         """
-        actions = []
-        timestamp = time.time()
-        memory = self._get_or_create_memory(node_id)
-        
         # Reduce monitoring frequency
         monitoring_action = self._adjust_monitoring(
             node_id,
             HealingActionType.ADAPTIVE_MONITORING_DECREASE,
-            "de_escalation_recovery"
+            "de_escalation_recovery",
+            timestamp
         )
-        actions.append(monitoring_action)
+        if monitoring_action is not None:
+            actions.append(monitoring_action)
         
         # Clear simulated modifiers (system recovered naturally)
-        if node_id in self.health_modifiers:
-            del self.health_modifiers[node_id]
-        if node_id in self.anomaly_modifiers:
-            del self.anomaly_modifiers[node_id]
+        self.health_modifiers.pop(node_id, None)
+        self.anomaly_modifiers.pop(node_id, None)
         
         # Reset healing state
         memory.active_healing = False
@@ -444,7 +486,7 @@ class AutoHealer:
             action_type="REAL",
             result="Incident auto-resolved due to sustained recovery",
             confidence=0.80,
-            verification_status=VerificationStatus.SUCCESS.value,
+            verification_status=STATUS_SUCCESS,
             timestamp=timestamp,
             details={
                 "health_score": health_score,
@@ -452,15 +494,17 @@ class AutoHealer:
                 "recovery_confirmed": True
             }
         ))
-        
-        return actions
     
     def _execute_stable_maintenance(
         self,
+        actions: List[HealingAction],
         node_id: str,
         health_score: float,
-        anomaly_score: float
-    ) -> List[HealingAction]:
+        anomaly_score: float,
+        confidence: float,
+        memory: HealingMemory,
+        timestamp: float
+    ):
         """
         Respond to NO_ACTION decision (stable system)
         
@@ -468,17 +512,16 @@ class AutoHealer:
         1. Gradually return to baseline monitoring
         2. Clear any stale modifiers
         """
-        actions = []
-        timestamp = time.time()
         state = self._get_or_create_monitoring_state(node_id)
+        old_interval = state.current_interval_seconds
         
-        # Only adjust if not already at baseline
-        if state.current_interval_seconds != self.base_sampling_interval:
+        # Only adjust if not already at baseline (a healthy node's usual case skips this)
+        if old_interval != self.base_sampling_interval:
             # Gradual return to baseline
-            if state.current_interval_seconds < self.base_sampling_interval:
+            if old_interval < self.base_sampling_interval:
                 new_interval = min(
                     self.base_sampling_interval,
-                    state.current_interval_seconds * 1.5
+                    old_interval * 1.5
                 )
             else:
                 new_interval = self.base_sampling_interval
@@ -493,31 +536,30 @@ class AutoHealer:
                 action_type="REAL",
                 result=f"Monitoring interval adjusting to {new_interval:.1f}s",
                 confidence=0.90,
-                verification_status=VerificationStatus.SUCCESS.value,
+                verification_status=STATUS_SUCCESS,
                 timestamp=timestamp,
                 details={
-                    "previous_interval": state.current_interval_seconds,
+                    "previous_interval": old_interval,
                     "new_interval": new_interval,
                     "target_interval": self.base_sampling_interval
                 }
             ))
         
         # Clear stale modifiers
-        if node_id in self.health_modifiers:
-            del self.health_modifiers[node_id]
-        if node_id in self.anomaly_modifiers:
-            del self.anomaly_modifiers[node_id]
-        
-        return actions
+        self.health_modifiers.pop(node_id, None)
+        self.anomaly_modifiers.pop(node_id, None)
     
     def _adjust_monitoring(
         self,
         node_id: str,
         action_type: HealingActionType,
-        reason: str
-    ) -> HealingAction:
-        """Adjust monitoring frequency adaptively"""
-        timestamp = time.time()
+        reason: str,
+        timestamp: float
+    ) -> Optional[HealingAction]:
+        """
+        Adjust monitoring frequency adaptively
+        Returns None when the interval is already at its limit (nothing to record)
+        """
         state = self._get_or_create_monitoring_state(node_id)
         old_interval = state.current_interval_seconds
         
@@ -534,6 +576,9 @@ class AutoHealer:
                 old_interval * 1.5  # Increase by 50%
             )
         
+        if new_interval == old_interval:
+            return None
+        
         state.current_interval_seconds = new_interval
         state.last_adjustment_time = timestamp
         state.reason = reason
@@ -544,7 +589,7 @@ class AutoHealer:
             action_type="REAL",
             result=f"Sampling interval: {old_interval:.1f}s → {new_interval:.1f}s",
             confidence=0.90,
-            verification_status=VerificationStatus.SUCCESS.value,
+            verification_status=STATUS_SUCCESS,
             timestamp=timestamp,
             details={
                 "previous_interval": old_interval,
@@ -556,14 +601,14 @@ class AutoHealer:
     def _verify_healing(
         self,
         node_id: str,
-        current_health: float
+        current_health: float,
+        memory: HealingMemory,
+        timestamp: float
     ) -> HealingAction:
         """
         VERIFICATION LOOP
         Check if healing was successful
         """
-        timestamp = time.time()
-        memory = self._get_or_create_memory(node_id)
         
         if memory.pre_healing_health is None:
             return HealingAction(
@@ -572,7 +617,7 @@ class AutoHealer:
                 action_type="REAL",
                 result="No baseline health to verify against",
                 confidence=0.5,
-                verification_status=VerificationStatus.PENDING.value,
+                verification_status=STATUS_PENDING,
                 timestamp=timestamp,
                 details={}
             )
@@ -618,6 +663,58 @@ class AutoHealer:
             }
         )
     
+    def expire_verifications(self, now: Optional[float] = None) -> List[HealingAction]:
+        """
+        Fail pending verifications of nodes that stopped reporting.
+        Verification normally runs on the node's next report (process_decision), which
+        also closes it once the deadline has passed; this background check only fails
+        nodes with no report for longer than max_sampling_interval.
+        """
+        timestamp = now if now is not None else time.time()
+        actions = []
+        deadlines = self.verification_deadlines
+        still_reporting = []
+        
+        # Only deadlines that have passed are visited, not every node
+        while deadlines and deadlines[0][0] < timestamp:
+            deadline, node_id = heapq.heappop(deadlines)
+            memory = self.healing_memories.get(node_id)
+            if memory is None or not memory.verification_pending or memory.verification_deadline != deadline:
+                continue
+            
+            # A live node's next report will verify it - check again on a later sweep
+            if (memory.last_report_time is not None and
+                    timestamp - memory.last_report_time <= self.max_sampling_interval):
+                still_reporting.append((deadline, node_id))
+                continue
+            
+            memory.verification_pending = False
+            memory.consecutive_failures += 1
+            action = HealingAction(
+                node_id=node_id,
+                action="VERIFICATION_CHECK",
+                action_type="REAL",
+                result="Healing FAILED: No report received within the verification window",
+                confidence=0.85,
+                verification_status=STATUS_FAILED,
+                timestamp=timestamp,
+                details={
+                    "pre_healing_health": memory.pre_healing_health,
+                    "verification_deadline": memory.verification_deadline,
+                    "last_report_time": memory.last_report_time,
+                    "consecutive_failures": memory.consecutive_failures
+                }
+            )
+            self.healing_history.append(action)
+            memory.healing_attempts.append(action)
+            actions.append(action)
+            self.history_version += 1
+        
+        for entry in still_reporting:
+            heapq.heappush(deadlines, entry)
+        
+        return actions
+    
     def get_health_modifier(self, node_id: str) -> float:
         """Get current health modifier for a node (for simulated healing)"""
         return self.health_modifiers.get(node_id, 0.0)
@@ -628,13 +725,17 @@ class AutoHealer:
     
     def get_monitoring_interval(self, node_id: str) -> float:
         """Get current recommended monitoring interval for a node"""
-        state = self._get_or_create_monitoring_state(node_id)
-        return state.current_interval_seconds
+        state = self.monitoring_states.get(node_id)
+        return state.current_interval_seconds if state is not None else self.base_sampling_interval
     
     def get_healing_status(self, node_id: str) -> Dict:
-        """Get current healing status for a node"""
-        memory = self._get_or_create_memory(node_id)
-        state = self._get_or_create_monitoring_state(node_id)
+        """
+        Get current healing status for a node
+        Read-only: polling never creates, reorders or evicts node state
+        (unknown nodes report their initial state)
+        """
+        memory = self.healing_memories.get(node_id) or self._new_memory(node_id)
+        state = self.monitoring_states.get(node_id) or self._new_monitoring_state(node_id)
         
         return {
             "node_id": node_id,
@@ -649,15 +750,11 @@ class AutoHealer:
     
     def get_healing_history(self, limit: int = 10) -> List[Dict]:
         """Get recent healing actions across all nodes"""
-        return [asdict(action) for action in list(self.healing_history)[-limit:]]
+        return [action.to_dict() for action in list(self.healing_history)[-limit:]]
     
     def clear_node_state(self, node_id: str):
         """Clear all healing state when node disconnects"""
-        if node_id in self.healing_memories:
-            del self.healing_memories[node_id]
-        if node_id in self.monitoring_states:
-            del self.monitoring_states[node_id]
-        if node_id in self.health_modifiers:
-            del self.health_modifiers[node_id]
-        if node_id in self.anomaly_modifiers:
-            del self.anomaly_modifiers[node_id]
+        self.healing_memories.pop(node_id, None)
+        self.monitoring_states.pop(node_id, None)
+        self.health_modifiers.pop(node_id, None)
+        self.anomaly_modifiers.pop(node_id, None)
@@ -11,9 +11,11 @@ A true autonomous agent that:
 This is NOT a chatbot. This is a decision-making agent.
 """
 
+from __future__ import annotations
+
 import time
-from collections import deque, defaultdict
-from dataclasses import dataclass, asdict
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
@@ -35,11 +37,11 @@ class HealthTrend(Enum):
     CRITICAL_DECLINE = "CRITICAL_DECLINE"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMemory:
     """Memory state for a single node"""
     node_id: str
-    health_history: deque  # Sliding window of (timestamp, health_score)
+    health_history: deque  # Sliding window of health scores
     anomaly_history: deque  # Sliding window of anomaly scores
     degradation_counter: int  # How many consecutive cycles of degradation
     recovery_counter: int  # How many consecutive cycles of recovery
@@ -53,11 +55,11 @@ class AgentMemory:
     connection_state: str = "CONNECTED"
     last_heartbeat_time: Optional[float] = None
     # CPU tracking for sustained high usage warning
-    cpu_high_start_time: Optional[float] = None  # When CPU first went high
+    cpu_high_start_time: Optional[float] = None  # time.monotonic() when CPU first went high
     cpu_warning_issued: bool = False  # Prevent repeated warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentReasoning:
     """Structured output of agent's decision process"""
     node_id: str
@@ -74,6 +76,39 @@ class AgentReasoning:
     # NEW: Include agent state awareness
     agent_status: str = "ACTIVE"
     connection_state: str = "CONNECTED"
+    
+    def to_decision_dict(self) -> Dict:
+        """The agent_decision fields returned by the API"""
+        # Explicit literal: the API exposes 8 of the 13 fields in its own order,
+        # so vars()/asdict() would leak fields and a fields() loop is ~2.5x slower
+        return {
+            "decision": self.decision,
+            "confidence": self.confidence,
+            "contributing_factors": self.contributing_factors,
+            "persistence": self.persistence,
+            "health_trend": self.health_trend,
+            "trend_velocity": self.trend_velocity,
+            "reasoning_chain": self.reasoning_chain,
+            "timestamp": self.timestamp
+        }
+    
+    def to_dict(self) -> Dict:
+        """Same as dataclasses.asdict, without its recursive deepcopy (the lists hold only strings)"""
+        return {
+            "node_id": self.node_id,
+            "decision": self.decision,
+            "confidence": self.confidence,
+            "contributing_factors": list(self.contributing_factors),
+            "persistence": self.persistence,
+            "health_trend": self.health_trend,
+            "health_score": self.health_score,
+            "anomaly_score": self.anomaly_score,
+            "trend_velocity": self.trend_velocity,
+            "timestamp": self.timestamp,
+            "reasoning_chain": list(self.reasoning_chain),
+            "agent_status": self.agent_status,
+            "connection_state": self.connection_state
+        }
 
 
 class DecisionAgent:
@@ -88,13 +123,18 @@ class DecisionAgent:
     5. EXPLAIN: Provide structured reasoning
     """
     
+    # Sustained CPU tracking
+    CPU_HIGH_THRESHOLD = 95.0  # Consider >= 95% as "high"
+    CPU_WARNING_DURATION = 20.0  # Warn after 20 seconds
+    
     def __init__(
         self,
         memory_window_size: int = 20,
         degradation_threshold: float = 70.0,
         critical_threshold: float = 50.0,
         anomaly_threshold: float = 0.6,
-        persistence_threshold: int = 3
+        persistence_threshold: int = 3,
+        max_nodes: int = 10000
     ):
         """
         Initialize the decision agent with configurable thresholds
@@ -105,35 +145,44 @@ class DecisionAgent:
             critical_threshold: Health score indicating critical state
             anomaly_threshold: Anomaly score above which triggers concern
             persistence_threshold: How many cycles before action is taken
+            max_nodes: Most node memories kept (least recently updated are forgotten)
         """
         self.memory_window_size = memory_window_size
         self.degradation_threshold = degradation_threshold
         self.critical_threshold = critical_threshold
         self.anomaly_threshold = anomaly_threshold
         self.persistence_threshold = persistence_threshold
+        self.max_nodes = max_nodes
         
-        # Memory storage per node
-        self.node_memories: Dict[str, AgentMemory] = {}
+        # Memory storage per node (LRU order: least recently updated first)
+        self.node_memories: "OrderedDict[str, AgentMemory]" = OrderedDict()
         
         # Decision history for feedback loops
         self.decision_history: deque = deque(maxlen=100)
+        # Bumped on every new decision (lets the API answer unchanged polls with 304s)
+        self.history_version = 0
     
     def _get_or_create_memory(self, node_id: str) -> AgentMemory:
         """Get existing memory or create new memory for a node"""
-        if node_id not in self.node_memories:
-            self.node_memories[node_id] = AgentMemory(
-                node_id=node_id,
-                health_history=deque(maxlen=self.memory_window_size),
-                anomaly_history=deque(maxlen=self.memory_window_size),
-                degradation_counter=0,
-                recovery_counter=0,
-                agent_state=None,
-                connection_state="CONNECTED",
-                last_heartbeat_time=None,
-                cpu_high_start_time=None,
-                cpu_warning_issued=False
-            )
-        return self.node_memories[node_id]
+        memory = self.node_memories.get(node_id)
+        if memory is not None:
+            self.node_memories.move_to_end(node_id)
+            return memory
+        if len(self.node_memories) >= self.max_nodes:
+            self.node_memories.popitem(last=False)
+        memory = self.node_memories[node_id] = AgentMemory(
+            node_id=node_id,
+            health_history=deque(maxlen=self.memory_window_size),
+            anomaly_history=deque(maxlen=self.memory_window_size),
+            degradation_counter=0,
+            recovery_counter=0,
+            agent_state=None,
+            connection_state="CONNECTED",
+            last_heartbeat_time=None,
+            cpu_high_start_time=None,
+            cpu_warning_issued=False
+        )
+        return memory
     
     def perceive(
         self,
@@ -165,8 +214,8 @@ class DecisionAgent:
         memory = self._get_or_create_memory(node_id)
         
         # Update memory with new observations
-        memory.health_history.append((timestamp, health_score))
-        memory.anomaly_history.append((timestamp, anomaly_score))
+        memory.health_history.append(health_score)
+        memory.anomaly_history.append(anomaly_score)
         memory.incident_state = incident_state
         memory.last_heartbeat_time = timestamp
         memory.connection_state = "CONNECTED"
@@ -177,20 +226,21 @@ class DecisionAgent:
         
         # NEW: Track CPU sustained high usage (>= 95% for 20+ seconds)
         cpu_warning = None
-        if metrics and metrics.get("cpu"):
-            cpu_usage = metrics["cpu"].get("usage_percent", 0)
-            CPU_HIGH_THRESHOLD = 95.0  # Consider >= 95% as "high"
-            CPU_WARNING_DURATION = 20.0  # Warn after 20 seconds
+        cpu_metrics = metrics.get("cpu") if metrics is not None else None
+        if cpu_metrics:
+            cpu_usage = cpu_metrics.get("usage_percent", 0)
             
-            if cpu_usage >= CPU_HIGH_THRESHOLD:
+            if cpu_usage >= self.CPU_HIGH_THRESHOLD:
+                # Durations use the monotonic clock so wall-clock jumps can't skew them
+                now = time.monotonic()
                 if memory.cpu_high_start_time is None:
                     # CPU just went high
-                    memory.cpu_high_start_time = timestamp
+                    memory.cpu_high_start_time = now
                     memory.cpu_warning_issued = False
                 else:
                     # CPU has been high - check duration
-                    duration = timestamp - memory.cpu_high_start_time
-                    if duration >= CPU_WARNING_DURATION and not memory.cpu_warning_issued:
+                    duration = now - memory.cpu_high_start_time
+                    if duration >= self.CPU_WARNING_DURATION and not memory.cpu_warning_issued:
                         cpu_warning = f"⚠️ CPU at {cpu_usage:.1f}% for {duration:.0f}s"
                         memory.cpu_warning_issued = True
             else:
@@ -235,6 +285,7 @@ class DecisionAgent:
         
         # Store in decision history for feedback
         self.decision_history.append(agent_reasoning)
+        self.history_version += 1
         
         return agent_reasoning
     
@@ -331,17 +382,13 @@ class DecisionAgent:
         if len(health_history) < 3:
             return HealthTrend.STABLE, 0.0
         
-        # Calculate linear trend over recent history
-        recent_window = 5
-        recent = list(health_history)[-recent_window:]
-        
-        if len(recent) < 2:
-            return HealthTrend.STABLE, 0.0
+        # Calculate linear trend over recent history (read in place, no list copy)
+        recent_window = min(5, len(health_history))
         
         # Simple velocity: change per time step
-        first_health = recent[0][1]
-        last_health = recent[-1][1]
-        velocity = (last_health - first_health) / len(recent)
+        first_health = health_history[-recent_window]
+        last_health = health_history[-1]
+        velocity = (last_health - first_health) / recent_window
         
         # Classify trend
         if velocity < -3.0:
@@ -363,7 +410,7 @@ class DecisionAgent:
         if len(anomaly_history) < 3:
             return "insufficient_data"
         
-        recent = [score for _, score in list(anomaly_history)[-5:]]
+        recent = [anomaly_history[i] for i in range(-min(5, len(anomaly_history)), 0)]
         avg_anomaly = sum(recent) / len(recent)
         
         if avg_anomaly > self.anomaly_threshold:
@@ -419,7 +466,7 @@ class DecisionAgent:
             factors.append("critical_health_persistent")
             factors.append(f"degradation_count_{memory.degradation_counter}")
             
-            if trend == HealthTrend.CRITICAL_DECLINE:
+            if trend is HealthTrend.CRITICAL_DECLINE:
                 factors.append("accelerating_decline")
                 return AgentDecision.PREDICT_FAILURE, 0.95, factors
             else:
@@ -427,14 +474,14 @@ class DecisionAgent:
                 return AgentDecision.AUTO_HEAL, 0.85, factors
         
         # 2. DEGRADING WITH PERSISTENCE → ESCALATE
-        if trend in [HealthTrend.DEGRADING, HealthTrend.CRITICAL_DECLINE]:
+        if trend is HealthTrend.DEGRADING or trend is HealthTrend.CRITICAL_DECLINE:
             if memory.degradation_counter >= self.persistence_threshold:
                 factors.append("persistent_degradation")
                 factors.append(f"velocity_{velocity:.2f}")
                 return AgentDecision.ESCALATE, 0.80, factors
         
         # 3. IMPROVING AFTER DEGRADATION → DE_ESCALATE
-        if trend == HealthTrend.IMPROVING and memory.degradation_counter > 0:
+        if trend is HealthTrend.IMPROVING and memory.degradation_counter > 0:
             factors.append("recovery_detected")
             factors.append(f"recovery_count_{memory.recovery_counter}")
             
@@ -448,7 +495,7 @@ class DecisionAgent:
             return AgentDecision.ESCALATE, 0.70, factors
         
         # 5. EARLY WARNING: DEGRADING BUT NOT YET PERSISTENT
-        if trend == HealthTrend.DEGRADING and memory.degradation_counter < self.persistence_threshold:
+        if trend is HealthTrend.DEGRADING and memory.degradation_counter < self.persistence_threshold:
             factors.append("early_degradation_signal")
             # If agent confirms degradation, give more weight
             if agent_degraded:
@@ -467,10 +514,10 @@ class DecisionAgent:
     
     def get_node_memory_summary(self, node_id: str) -> Optional[Dict]:
         """Get current memory state for a node (for debugging/visibility)"""
-        if node_id not in self.node_memories:
+        memory = self.node_memories.get(node_id)
+        if memory is None:
             return None
         
-        memory = self.node_memories[node_id]
         return {
             'node_id': node_id,
             'health_history_size': len(memory.health_history),
@@ -487,9 +534,8 @@ class DecisionAgent:
     
     def get_decision_history(self, limit: int = 10) -> List[Dict]:
         """Get recent decision history across all nodes"""
-        return [asdict(decision) for decision in list(self.decision_history)[-limit:]]
+        return [decision.to_dict() for decision in list(self.decision_history)[-limit:]]
     
     def clear_node_memory(self, node_id: str):
         """Clear memory when node disconnects"""
-        if node_id in self.node_memories:
-            del self.node_memories[node_id]
+        self.node_memories.pop(node_id, None)
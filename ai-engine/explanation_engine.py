@@ -17,17 +17,63 @@ NO cloud calls
 
 import httpx
 import asyncio
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import time
 import logging
+import re
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One "<number>. <explanation>" line of a batched LLM reply
+BATCH_ANSWER_PATTERN = re.compile(r"^\s*(\d+)[.):]\s*(.+)$")
+# Decisions per batched prompt: each answer costs about as long as a single explanation,
+# so larger prompts would not finish within a (scaled) request timeout
+BATCH_PROMPT_SIZE = 4
 
-@dataclass
+# The prompt asks for one sentence - stop at the first paragraph break instead of
+# spending the rest of num_predict on follow-up paragraphs
+SINGLE_ANSWER_STOP = ["\n\n"]
+
+# Keep the model loaded between cycles (Ollama unloads idle models after 5 minutes by default)
+MODEL_KEEP_ALIVE = "30m"
+# Loading the model from disk can take far longer than a normal request
+WARMUP_TIMEOUT_SECONDS = 60.0
+
+
+def persistence_bucket(persistence: int) -> str:
+    """
+    Cycle count as the LLM sees it
+    Nearby counts explain the same way, so they share a prompt (and a cache entry)
+    """
+    if persistence < 3:
+        return "0-2"
+    if persistence < 8:
+        return "3-7"
+    return "8+"
+
+
+# Deterministic explanations per decision (only the chosen one is formatted)
+FALLBACK_TEMPLATES = {
+    "NO_ACTION": "System operating normally. Health trend: {trend_lower}. Confidence: {confidence:.0%}. Monitoring continues.",
+    
+    "ESCALATE": "[ALERT] Escalated. {trend_title} trend detected for {persistence} cycles. Root cause: {root_cause}. Contributing factors: {factors}. Confidence: {confidence:.0%}.",
+    
+    "DE_ESCALATE": "[RESOLVED] Recovery confirmed. Health improving after {persistence} cycles. Trend: {trend_lower}. Alert level reduced.",
+    
+    "PREDICT_FAILURE": "[CRITICAL] Failure predicted. {trend_title} for {persistence} cycles. Root cause: {root_cause}. Immediate attention required. Confidence: {confidence:.0%}.",
+    
+    "AUTO_HEAL": "[REMEDIATION] Auto-healing initiated. Degradation detected: {root_cause}. Trend: {trend_lower} for {persistence} cycles. Applying corrective actions. Confidence: {confidence:.0%}.",
+    
+    "INVESTIGATE": "[REVIEW] Investigation recommended. Anomaly detected in {root_cause}. Trend: {trend_lower}. Factors: {factors}. Confidence: {confidence:.0%}."
+}
+DEFAULT_FALLBACK_TEMPLATE = "Agent decision: {decision}. Health trend: {trend}. Persistence: {persistence} cycles. Root cause: {root_cause}. Confidence: {confidence:.0%}."
+
+
+@dataclass(slots=True)
 class ExplanationRequest:
     """Structured input for explanation generation"""
     decision: str
@@ -39,11 +85,11 @@ class ExplanationRequest:
     contributing_factors: list
 
 
-@dataclass 
+@dataclass(slots=True)
 class ExplanationResponse:
     """Structured output from explanation engine"""
     explanation: str
-    generated_by: str  # "ollama" or "fallback"
+    generated_by: str  # "ollama", "cache", "direct" or "fallback"
     model: str
     latency_ms: float
     success: bool
@@ -61,6 +107,9 @@ class ExplanationEngine:
     The agent system works INDEPENDENTLY of this module.
     """
     
+    # Decisions whose template explanation is authoritative (never sent to the LLM)
+    DIRECT_DECISIONS = frozenset({"NO_ACTION", "DE_ESCALATE"})
+    
     def __init__(
         self,
         ollama_url: str = "http://localhost:11434",
@@ -83,36 +132,103 @@ class ExplanationEngine:
         self.enabled = enabled
         self.available = False  # Set after health check
         
-        # Large cache for repeated explanations (avoid redundant LLM calls)
+        # Large LRU cache for repeated explanations (avoid redundant LLM calls)
         # Most decisions repeat, so caching is very effective
-        self.explanation_cache: Dict[str, str] = {}
+        # Entries: prompt inputs -> (explanation, time cached); regenerated after cache_ttl_seconds
+        self.explanation_cache: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
         self.cache_max_size = 200  # Increased cache size
+        self.cache_ttl_seconds = 600.0
+        # Ollama generations in flight, by cache key (identical concurrent misses share one)
+        self.pending_generations: Dict[tuple, asyncio.Future] = {}
+        
+        # Shared async client for the app's lifetime (keep-alive connections to Ollama;
+        # HTTP/2 is used when the endpoint negotiates it)
+        self._client = self._create_client()
+        # Shared requests session for the sync path (created on first use)
+        self._session = None
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.ollama_url,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=self.timeout_seconds
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared async HTTP client, reopening it if it was closed"""
+        if self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+    
+    def _get_session(self):
+        """Return the shared requests session, creating it on first use"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP clients"""
+        await self._client.aclose()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     async def check_availability(self) -> bool:
         """Check if Ollama is available"""
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:  # Fast check
-                response = await client.get(f"{self.ollama_url}/api/tags")
-                if response.status_code == 200:
-                    self.available = True
-                    logger.info(f"Ollama available at {self.ollama_url}")
-                    return True
+            client = self._get_client()
+            response = await client.get("/api/tags", timeout=2.0)  # Fast check
+            if response.status_code == 200:
+                self.available = True
+                logger.info("Ollama available at %s", self.ollama_url)
+                return True
         except Exception as e:
-            logger.warning(f"Ollama not available (using fallback): {e}")
+            logger.warning("Ollama not available (using fallback): %s", e)
             self.available = False
         return False
     
+    async def warmup(self) -> bool:
+        """
+        Load the model into memory with a one-token generation
+        (otherwise the first real explanation pays the load time and times out)
+        """
+        start_time = time.time()
+        try:
+            client = self._get_client()
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": "ok",
+                    "stream": False,
+                    "keep_alive": MODEL_KEEP_ALIVE,
+                    "options": {
+                        "temperature": 0,
+                        "num_predict": 1
+                    }
+                },
+                timeout=WARMUP_TIMEOUT_SECONDS
+            )
+            if response.status_code == 200:
+                logger.info("Ollama model %s loaded in %.0fms", self.model, (time.time() - start_time) * 1000)
+                return True
+            logger.warning("Ollama warm-up returned %s", response.status_code)
+        except Exception as e:
+            logger.warning("Ollama warm-up failed: %s", e)
+        return False
+    
     def check_availability_sync(self) -> bool:
         """Synchronous version of availability check"""
         try:
-            import requests
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2.0)  # Fast check
+            response = self._get_session().get(f"{self.ollama_url}/api/tags", timeout=2.0)  # Fast check
             if response.status_code == 200:
                 self.available = True
-                logger.info(f"Ollama available at {self.ollama_url}")
+                logger.info("Ollama available at %s", self.ollama_url)
                 return True
         except Exception as e:
-            logger.warning(f"Ollama not available (using fallback): {e}")
+            logger.warning("Ollama not available (using fallback): %s", e)
             self.available = False
         return False
     
@@ -127,46 +243,85 @@ class ExplanationEngine:
 
 Decision: {request.decision}
 Trend: {request.health_trend}
-Cycles: {request.persistence}
+Cycles: {persistence_bucket(request.persistence)}
 Cause: {request.root_cause or "none"}
 Confidence: {request.confidence:.0%}
 
 Response:"""
         return prompt
     
+    def _build_batch_prompt(self, requests: List[ExplanationRequest]) -> str:
+        """
+        Build one prompt asking for a numbered explanation per decision
+        
+        IMPORTANT: Only structured data, no raw metrics
+        """
+        items = "\n".join(
+            f"{i}. Decision: {r.decision}, Trend: {r.health_trend}, Cycles: {persistence_bucket(r.persistence)}, "
+            f"Cause: {r.root_cause or 'none'}, Confidence: {r.confidence:.0%}"
+            for i, r in enumerate(requests, 1)
+        )
+        prompt = f"""AIOps analyst. Explain each agent decision in ONE sentence (max 30 words).
+Answer with exactly one line per decision, formatted "<number>. <explanation>".
+
+{items}
+
+Response:"""
+        return prompt
+    
+    def _cache_key(self, request: ExplanationRequest) -> tuple:
+        """Everything the prompt is built from (confidence at the precision that matters)"""
+        return (request.decision, request.health_trend, persistence_bucket(request.persistence),
+                (request.root_cause or "").strip().lower(), round(request.confidence, 1))
+    
+    def _get_cached(self, cache_key: tuple) -> Optional[str]:
+        """Cached explanation for this key, unless missing or expired"""
+        entry = self.explanation_cache.get(cache_key)
+        if entry is None:
+            return None
+        explanation, cached_at = entry
+        if time.monotonic() - cached_at > self.cache_ttl_seconds:
+            del self.explanation_cache[cache_key]
+            return None
+        self.explanation_cache.move_to_end(cache_key)
+        return explanation
+    
+    def _cache_explanation(self, cache_key: tuple, explanation: str):
+        self.explanation_cache[cache_key] = (explanation, time.monotonic())
+        self.explanation_cache.move_to_end(cache_key)
+        if len(self.explanation_cache) > self.cache_max_size:
+            # Remove least recently used entry
+            self.explanation_cache.popitem(last=False)
+    
+    def _direct_response(self, request: ExplanationRequest) -> ExplanationResponse:
+        """Template explanation for a decision in DIRECT_DECISIONS"""
+        return ExplanationResponse(
+            explanation=self._generate_fallback(request),
+            generated_by="direct",
+            model="none",
+            latency_ms=0,
+            success=True
+        )
+    
     def _generate_fallback(self, request: ExplanationRequest) -> str:
         """
         Generate a deterministic fallback explanation
         Used when Ollama is unavailable or disabled
         These templates provide good, context-aware explanations
         """
-        decision = request.decision
         trend = request.health_trend
-        persistence = request.persistence
-        root_cause = request.root_cause or "system load"
-        confidence = request.confidence
         factors = request.contributing_factors or []
         
-        # Build factor string
-        factor_str = ", ".join(factors[:3]) if factors else "general metrics"
-        
-        templates = {
-            "NO_ACTION": f"System operating normally. Health trend: {trend.lower()}. Confidence: {confidence:.0%}. Monitoring continues.",
-            
-            "ESCALATE": f"[ALERT] Escalated. {trend.replace('_', ' ').title()} trend detected for {persistence} cycles. Root cause: {root_cause}. Contributing factors: {factor_str}. Confidence: {confidence:.0%}.",
-            
-            "DE_ESCALATE": f"[RESOLVED] Recovery confirmed. Health improving after {persistence} cycles. Trend: {trend.lower()}. Alert level reduced.",
-            
-            "PREDICT_FAILURE": f"[CRITICAL] Failure predicted. {trend.replace('_', ' ').title()} for {persistence} cycles. Root cause: {root_cause}. Immediate attention required. Confidence: {confidence:.0%}.",
-            
-            "AUTO_HEAL": f"[REMEDIATION] Auto-healing initiated. Degradation detected: {root_cause}. Trend: {trend.lower()} for {persistence} cycles. Applying corrective actions. Confidence: {confidence:.0%}.",
-            
-            "INVESTIGATE": f"[REVIEW] Investigation recommended. Anomaly detected in {root_cause}. Trend: {trend.lower()}. Factors: {factor_str}. Confidence: {confidence:.0%}."
-        }
-        
-        return templates.get(
-            decision,
-            f"Agent decision: {decision}. Health trend: {trend}. Persistence: {persistence} cycles. Root cause: {root_cause}. Confidence: {confidence:.0%}."
+        template = FALLBACK_TEMPLATES.get(request.decision, DEFAULT_FALLBACK_TEMPLATE)
+        return template.format(
+            decision=request.decision,
+            trend=trend,
+            trend_lower=trend.lower(),
+            trend_title=trend.replace('_', ' ').title(),
+            persistence=request.persistence,
+            root_cause=request.root_cause or "system load",
+            confidence=request.confidence,
+            factors=", ".join(factors[:3]) if factors else "general metrics"
         )
     
     async def explain_async(self, request: ExplanationRequest) -> ExplanationResponse:
@@ -179,13 +334,18 @@ Response:"""
         Returns:
             ExplanationResponse with explanation and metadata
         """
+        # Routine decisions are fully explained by their template - no cache or LLM needed
+        if request.decision in self.DIRECT_DECISIONS:
+            return self._direct_response(request)
+        
         start_time = time.time()
         
         # Check cache first
-        cache_key = f"{request.decision}:{request.health_trend}:{request.persistence}:{request.root_cause}"
-        if cache_key in self.explanation_cache:
+        cache_key = self._cache_key(request)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             return ExplanationResponse(
-                explanation=self.explanation_cache[cache_key],
+                explanation=cached,
                 generated_by="cache",
                 model=self.model,
                 latency_ms=0,
@@ -203,52 +363,16 @@ Response:"""
                 success=True
             )
         
-        # Try Ollama
-        try:
-            prompt = self._build_prompt(request)
-            
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.3,  # Low temperature for consistency
-                            "num_predict": 50    # Short response = fast
-                        }
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    explanation = result.get("response", "").strip()
-                    
-                    # Clean up the response
-                    explanation = explanation.replace("\n\n", " ").strip()
-                    if not explanation:
-                        explanation = self._generate_fallback(request)
-                    
-                    # Cache the result
-                    if len(self.explanation_cache) >= self.cache_max_size:
-                        # Remove oldest entry
-                        oldest_key = next(iter(self.explanation_cache))
-                        del self.explanation_cache[oldest_key]
-                    self.explanation_cache[cache_key] = explanation
-                    
-                    return ExplanationResponse(
-                        explanation=explanation,
-                        generated_by="ollama",
-                        model=self.model,
-                        latency_ms=(time.time() - start_time) * 1000,
-                        success=True
-                    )
-                else:
-                    logger.warning(f"Ollama returned {response.status_code}")
-                    
-        except Exception as e:
-            logger.warning(f"Ollama request failed: {e}")
+        # Try Ollama (concurrent callers with the same prompt share one request)
+        explanation = await asyncio.shield(self._shared_generation(request, cache_key))
+        if explanation is not None:
+            return ExplanationResponse(
+                explanation=explanation,
+                generated_by="ollama",
+                model=self.model,
+                latency_ms=(time.time() - start_time) * 1000,
+                success=True
+            )
         
         # Fallback on any error
         fallback = self._generate_fallback(request)
@@ -260,6 +384,176 @@ Response:"""
             success=True
         )
     
+    def _shared_generation(self, request: ExplanationRequest, cache_key: tuple) -> asyncio.Future:
+        """The in-flight Ollama generation for cache_key, starting one if there is none"""
+        task = self.pending_generations.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_with_ollama(request, cache_key))
+            self.pending_generations[cache_key] = task
+            task.add_done_callback(lambda _: self.pending_generations.pop(cache_key, None))
+        return task
+    
+    async def _generate_with_ollama(self, request: ExplanationRequest, cache_key: tuple) -> Optional[str]:
+        """
+        Ask Ollama for one explanation and cache it
+        
+        Returns:
+            The explanation, or None if the request failed
+        """
+        try:
+            prompt = self._build_prompt(request)
+            
+            client = self._get_client()
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": MODEL_KEEP_ALIVE,
+                    "options": {
+                        "temperature": 0.3,  # Low temperature for consistency
+                        "num_predict": 50,   # Short response = fast
+                        "stop": SINGLE_ANSWER_STOP
+                    }
+                }
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                explanation = result.get("response", "").strip()
+                
+                # Clean up the response
+                explanation = explanation.replace("\n\n", " ").strip()
+                if not explanation:
+                    explanation = self._generate_fallback(request)
+                
+                # Cache the result
+                self._cache_explanation(cache_key, explanation)
+                return explanation
+            else:
+                logger.warning("Ollama returned %s", response.status_code)
+                
+        except Exception as e:
+            logger.warning("Ollama request failed: %s", e)
+        
+        return None
+    
+    async def _generate_batch_with_ollama(self, misses: Dict[tuple, ExplanationRequest]) -> Dict[tuple, str]:
+        """
+        Ask Ollama for several explanations with one numbered prompt and cache them
+        
+        Returns:
+            The explanations the reply answered, by cache key (empty if the request failed)
+        """
+        explanations = {}
+        try:
+            client = self._get_client()
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": self._build_batch_prompt(list(misses.values())),
+                    "stream": False,
+                    "keep_alive": MODEL_KEEP_ALIVE,
+                    "options": {
+                        "temperature": 0.3,
+                        "num_predict": 50 * len(misses)  # Same budget per decision
+                    }
+                },
+                timeout=self.timeout_seconds * len(misses)  # ... and the same time per decision
+            )
+            
+            if response.status_code == 200:
+                answers = {}
+                for line in response.json().get("response", "").splitlines():
+                    match = BATCH_ANSWER_PATTERN.match(line)
+                    if match:
+                        answers.setdefault(int(match.group(1)), match.group(2).strip())
+                
+                for i, cache_key in enumerate(misses, 1):
+                    if answers.get(i):
+                        explanations[cache_key] = answers[i]
+                        self._cache_explanation(cache_key, answers[i])
+            else:
+                logger.warning("Ollama returned %s", response.status_code)
+                
+        except Exception as e:
+            logger.warning("Ollama batch request failed: %s", e)
+        
+        return explanations
+    
+    async def explain_batch(self, requests: List[ExplanationRequest]) -> List[ExplanationResponse]:
+        """
+        Generate explanations for several decisions with as few Ollama requests as possible
+        
+        Cached decisions are answered from the cache; the rest (deduplicated) are
+        numbered in prompts of up to BATCH_PROMPT_SIZE decisions, sent concurrently,
+        and each reply is split back per decision.
+        Any decision the LLM doesn't answer gets the fallback explanation,
+        and DIRECT_DECISIONS get their template without asking.
+        
+        Returns:
+            One ExplanationResponse per request, in order
+        """
+        if len(requests) == 1:
+            return [await self.explain_async(requests[0])]
+        
+        start_time = time.time()
+        explanations: Dict[tuple, str] = {}
+        
+        # Cache hits up front (new answers may evict them), then distinct misses in order
+        cached: Dict[tuple, str] = {}
+        misses: Dict[tuple, ExplanationRequest] = {}
+        for request in requests:
+            if request.decision in self.DIRECT_DECISIONS:
+                continue
+            cache_key = self._cache_key(request)
+            explanation = self._get_cached(cache_key)
+            if explanation is not None:
+                cached[cache_key] = explanation
+            else:
+                misses.setdefault(cache_key, request)
+        
+        if misses and self.enabled and self.available:
+            items = list(misses.items())
+            chunks = [dict(items[i:i + BATCH_PROMPT_SIZE]) for i in range(0, len(items), BATCH_PROMPT_SIZE)]
+            for answered in await asyncio.gather(*(self._generate_batch_with_ollama(chunk) for chunk in chunks)):
+                explanations.update(answered)
+        
+        latency_ms = (time.time() - start_time) * 1000
+        responses = []
+        for request in requests:
+            if request.decision in self.DIRECT_DECISIONS:
+                responses.append(self._direct_response(request))
+                continue
+            cache_key = self._cache_key(request)
+            if cache_key in explanations:
+                responses.append(ExplanationResponse(
+                    explanation=explanations[cache_key],
+                    generated_by="ollama",
+                    model=self.model,
+                    latency_ms=latency_ms,
+                    success=True
+                ))
+            elif cache_key in cached:
+                responses.append(ExplanationResponse(
+                    explanation=cached[cache_key],
+                    generated_by="cache",
+                    model=self.model,
+                    latency_ms=0,
+                    success=True
+                ))
+            else:
+                responses.append(ExplanationResponse(
+                    explanation=self._generate_fallback(request),
+                    generated_by="fallback",
+                    model="none",
+                    latency_ms=latency_ms,
+                    success=True
+                ))
+        return responses
+    
     def explain_sync(self, request: ExplanationRequest) -> ExplanationResponse:
         """
         Generate explanation synchronously (for non-async contexts)
@@ -270,13 +564,18 @@ Response:"""
         Returns:
             ExplanationResponse with explanation and metadata
         """
+        # Routine decisions are fully explained by their template - no cache or LLM needed
+        if request.decision in self.DIRECT_DECISIONS:
+            return self._direct_response(request)
+        
         start_time = time.time()
         
         # Check cache first
-        cache_key = f"{request.decision}:{request.health_trend}:{request.persistence}:{request.root_cause}"
-        if cache_key in self.explanation_cache:
+        cache_key = self._cache_key(request)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             return ExplanationResponse(
-                explanation=self.explanation_cache[cache_key],
+                explanation=cached,
                 generated_by="cache",
                 model=self.model,
                 latency_ms=0,
@@ -296,18 +595,19 @@ Response:"""
         
         # Try Ollama synchronously
         try:
-            import requests
             prompt = self._build_prompt(request)
             
-            response = requests.post(
+            response = self._get_session().post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": MODEL_KEEP_ALIVE,
                     "options": {
                         "temperature": 0.3,
-                        "num_predict": 50  # Short response = fast
+                        "num_predict": 50,  # Short response = fast
+                        "stop": SINGLE_ANSWER_STOP
                     }
                 },
                 timeout=self.timeout_seconds
@@ -323,10 +623,7 @@ Response:"""
                     explanation = self._generate_fallback(request)
                 
                 # Cache
-                if len(self.explanation_cache) >= self.cache_max_size:
-                    oldest_key = next(iter(self.explanation_cache))
-                    del self.explanation_cache[oldest_key]
-                self.explanation_cache[cache_key] = explanation
+                self._cache_explanation(cache_key, explanation)
                 
                 return ExplanationResponse(
                     explanation=explanation,
@@ -337,7 +634,7 @@ Response:"""
                 )
                 
         except Exception as e:
-            logger.warning(f"Ollama sync request failed: {e}")
+            logger.warning("Ollama sync request failed: %s", e)
         
         # Fallback
         fallback = self._generate_fallback(request)
@@ -397,6 +694,40 @@ Response:"""
             "latency_ms": response.latency_ms
         }
     
+    async def explain_decision_async(
+        self,
+        decision: str,
+        root_cause: Optional[str],
+        health_trend: str,
+        persistence: int,
+        action_taken: Optional[str] = None,
+        confidence: float = 0.8,
+        contributing_factors: list = None
+    ) -> Dict:
+        """
+        Async version of explain_decision (Ollama call doesn't block the event loop)
+        
+        Returns dict with explanation and metadata
+        """
+        request = ExplanationRequest(
+            decision=decision,
+            root_cause=root_cause,
+            health_trend=health_trend,
+            persistence=persistence,
+            action_taken=action_taken,
+            confidence=confidence,
+            contributing_factors=contributing_factors or []
+        )
+        
+        response = await self.explain_async(request)
+        
+        return {
+            "explanation": response.explanation,
+            "generated_by": response.generated_by,
+            "model": response.model,
+            "latency_ms": response.latency_ms
+        }
+    
     def get_status(self) -> Dict:
         """Get explanation engine status"""
         return {
@@ -1,6 +1,11 @@
-def calculate_health(anomaly_score: float) -> dict:
+from functools import lru_cache
+
+
+@lru_cache(maxsize=16384, typed=True)
+def _health_for_score(anomaly_score: float) -> tuple:
     """
-    Converts anomaly score into system health score and risk level
+    (health_score, risk_level) for an anomaly score.
+    Scores arrive rounded to 4 decimals, so the cache covers every possible input.
     """
 
     # Normalize anomaly score to health (simple & explainable)
@@ -13,7 +18,17 @@ def calculate_health(anomaly_score: float) -> dict:
     else:
         risk = "CRITICAL"
 
+    return round(health_score, 2), risk
+
+
+def calculate_health(anomaly_score: float) -> dict:
+    """
+    Converts anomaly score into system health score and risk level
+    """
+    health_score, risk = _health_for_score(anomaly_score)
+
+    # Fresh dict per call so callers can't mutate the cached result
     return {
-        "health_score": round(health_score, 2),
+        "health_score": health_score,
         "risk_level": risk
     }
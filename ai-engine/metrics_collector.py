@@ -1,9 +1,29 @@
 import psutil
 import time
-import json
+import orjson
 from datetime import datetime, timezone
 
 
+BYTES_PER_MB = 1 << 20
+BYTES_PER_GB = 1 << 30
+
+# Disk usage changes slowly - reuse the statvfs result for a while
+DISK_USAGE_TTL_SECONDS = 30.0
+_disk_usage_cache = {}  # { disk_path: (monotonic time read, usage) }
+
+# Prime the CPU counters so the first non-blocking sample is meaningful
+psutil.cpu_percent(interval=None)
+
+
+def get_disk_usage(disk_path='/'):
+    """Return psutil.disk_usage(disk_path), cached for DISK_USAGE_TTL_SECONDS"""
+    now = time.monotonic()
+    cached = _disk_usage_cache.get(disk_path)
+    if cached is None or now - cached[0] >= DISK_USAGE_TTL_SECONDS:
+        cached = (now, psutil.disk_usage(disk_path))
+        _disk_usage_cache[disk_path] = cached
+    return cached[1]
+
 
 def collect_system_metrics():
     """
@@ -11,10 +31,11 @@ def collect_system_metrics():
     Returns a dictionary (JSON serializable).
     """
 
-    cpu_percent = psutil.cpu_percent(interval=1)
+    # Non-blocking: CPU usage since the previous sample
+    cpu_percent = psutil.cpu_percent(interval=None)
 
     virtual_memory = psutil.virtual_memory()
-    disk_usage = psutil.disk_usage('/')
+    disk_usage = get_disk_usage('/')
     net_io = psutil.net_io_counters()
 
     metrics = {
@@ -23,13 +44,13 @@ def collect_system_metrics():
             "usage_percent": cpu_percent
         },
         "memory": {
-            "total_mb": round(virtual_memory.total / (1024 * 1024), 2),
-            "used_mb": round(virtual_memory.used / (1024 * 1024), 2),
+            "total_mb": round(virtual_memory.total / BYTES_PER_MB, 2),
+            "used_mb": round(virtual_memory.used / BYTES_PER_MB, 2),
             "usage_percent": virtual_memory.percent
         },
         "disk": {
-            "total_gb": round(disk_usage.total / (1024 * 1024 * 1024), 2),
-            "used_gb": round(disk_usage.used / (1024 * 1024 * 1024), 2),
+            "total_gb": round(disk_usage.total / BYTES_PER_GB, 2),
+            "used_gb": round(disk_usage.used / BYTES_PER_GB, 2),
             "usage_percent": disk_usage.percent
         },
         "network": {
@@ -46,5 +67,5 @@ if __name__ == "__main__":
 
     while True:
         data = collect_system_metrics()
-        print(json.dumps(data, indent=2))
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
         time.sleep(2)
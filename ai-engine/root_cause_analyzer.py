@@ -1,5 +1,5 @@
 from collections import deque
-import statistics
+import math
 
 
 class RootCauseAnalyzer:
@@ -50,6 +50,13 @@ class RootCauseAnalyzer:
             "network_rate": 0.1  # Network fluctuations are NORMAL, ignore mostly
         }
 
+    def reset(self):
+        """Clear all history (used when recycling analyzers across nodes)"""
+        for values in self.history.values():
+            values.clear()
+        self.prev_network_bytes = None
+        self.recent_causes.clear()
+
     def update(self, metrics: dict):
         """Update rolling history with latest metrics"""
 
@@ -69,19 +76,22 @@ class RootCauseAnalyzer:
 
     def analyze(self, metrics: dict) -> dict:
         deviations = {}
+        total_dev = 0.0
 
         # Compute weighted deviation from rolling baseline
         for key, values in self.history.items():
             if len(values) < 5:
                 continue
 
-            baseline = statistics.mean(values)
+            # fsum/len is within an ulp of statistics.mean at a fraction of its cost
+            baseline = math.fsum(values) / len(values)
             current = values[-1]
 
             if baseline > 0:
                 raw_deviation = abs(current - baseline) / baseline
                 weighted_deviation = raw_deviation * self.metric_weights[key]
                 deviations[key] = weighted_deviation
+                total_dev += weighted_deviation
 
         if not deviations:
             return {
@@ -108,7 +118,6 @@ class RootCauseAnalyzer:
         final_confidence = round(normalized_confidence * persistence_factor, 2)
 
         # Contribution breakdown (explainability)
-        total_dev = sum(deviations.values())
         contributors = {
             self.label_map[k]: round(v / total_dev, 2)
             for k, v in deviations.items()
@@ -21,7 +21,6 @@ This script is SIMULATION ONLY - no OS-level changes are made.
 
 import subprocess
 import sys
-import time
 import argparse
 import signal
 import os
@@ -33,7 +32,8 @@ def get_python_executable():
     return sys.executable
 
 
-def launch_agent(node_id: str, backend_url: str, interval: int, demo_stress: bool, no_realistic: bool) -> subprocess.Popen:
+def launch_agent(node_id: str, backend_url: str, interval: int, demo_stress: bool, no_realistic: bool,
+                 start_delay: float = 0.0) -> subprocess.Popen:
     """
     Launch a single PC agent as a subprocess
     
@@ -43,6 +43,7 @@ def launch_agent(node_id: str, backend_url: str, interval: int, demo_stress: boo
         interval: Metric collection interval
         demo_stress: Enable legacy stress simulation
         no_realistic: Disable realistic probabilistic degradation
+        start_delay: Seconds the agent waits before its first metrics cycle
         
     Returns:
         Popen process handle
@@ -64,6 +65,9 @@ def launch_agent(node_id: str, backend_url: str, interval: int, demo_stress: boo
     if no_realistic:
         cmd.append("--no-realistic")
     
+    if start_delay > 0:
+        cmd.extend(["--start-delay", str(start_delay)])
+    
     print(f"[LAUNCHER] Starting agent: {node_id}")
     print(f"[LAUNCHER] Command: {' '.join(cmd)}")
     
@@ -189,7 +193,8 @@ WHAT TO OBSERVE:
     print("=" * 60)
     print()
     
-    # Launch agents with staggered start
+    # Launch all agents at once; each delays its first cycle by one second more than the
+    # previous so they don't all report at exactly the same time
     for i in range(1, args.agents + 1):
         node_id = f"{args.prefix}-{i}"
         process = launch_agent(
@@ -197,12 +202,10 @@ WHAT TO OBSERVE:
             backend_url=args.backend_url,
             interval=args.interval,
             demo_stress=args.demo_stress,
-            no_realistic=args.no_realistic
+            no_realistic=args.no_realistic,
+            start_delay=float(i - 1)
         )
         processes.append(process)
-        
-        # Stagger agent starts to avoid all starting at exactly the same time
-        time.sleep(1)
     
     print()
     print("=" * 60)
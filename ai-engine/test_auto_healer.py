@@ -0,0 +1,85 @@
+"""
+TEST SCRIPT FOR AUTO HEALER
+Verifies that expired healing verifications only fail nodes that stopped reporting
+"""
+
+import sys
+from unittest import mock
+from auto_healer import AutoHealer
+
+
+def report(healer, node_id, at, decision, health):
+    """Feed one decision to the healer as if it arrived at time `at`"""
+    with mock.patch("auto_healer.time.time", return_value=at):
+        return healer.process_decision(node_id, decision, health, 0.7, 0.9)
+
+
+def verification_results(actions):
+    return [a.verification_status for a in actions if a.action == "VERIFICATION_CHECK"]
+
+
+def test_stalled_node_verification_expires():
+    """Test: A node that goes silent after AUTO_HEAL is failed by the sweep"""
+    healer = AutoHealer()
+    report(healer, "STALLED", 1000.0, "AUTO_HEAL", 40.0)
+    deadline = 1000.0 + healer.verification_window_seconds
+    
+    # Deadline passed and nothing heard for longer than max_sampling_interval
+    expired = healer.expire_verifications(now=deadline + 2)
+    
+    assert len(expired) == 1
+    assert expired[0].node_id == "STALLED"
+    assert expired[0].verification_status == "FAILED"
+    assert not healer.healing_memories["STALLED"].verification_pending
+    assert healer.healing_memories["STALLED"].consecutive_failures == 1
+    print("\n✅ Stalled node verification expired")
+
+
+def test_reporting_node_is_verified_by_its_next_report():
+    """Test: A node still reporting past its deadline is verified by its report, not the sweep"""
+    healer = AutoHealer()
+    report(healer, "LIVE", 1000.0, "AUTO_HEAL", 40.0)
+    for at in (1005.0, 1010.0, 1015.0, 1020.0, 1025.0, 1030.0):
+        report(healer, "LIVE", at, "NO_ACTION", 40.0)
+    
+    # Sweep runs just after the deadline (1030) but before the next report
+    assert healer.expire_verifications(now=1032.0) == []
+    assert healer.healing_memories["LIVE"].verification_pending
+    
+    # The next report shows a 20 point improvement
+    actions = report(healer, "LIVE", 1035.0, "NO_ACTION", 60.0)
+    assert verification_results(actions) == ["SUCCESS"]
+    assert not healer.healing_memories["LIVE"].verification_pending
+    
+    # Nothing left for later sweeps
+    assert healer.expire_verifications(now=1100.0) == []
+    assert healer.verification_deadlines == []
+    print("\n✅ Reporting node verified by its own report")
+
+
+def test_node_that_stops_after_deadline_expires_later():
+    """Test: The sweep keeps checking a node that was live at its deadline"""
+    healer = AutoHealer()
+    report(healer, "LATE", 1000.0, "AUTO_HEAL", 40.0)
+    report(healer, "LATE", 1028.0, "NO_ACTION", 40.0)
+    
+    assert healer.expire_verifications(now=1032.0) == []
+    expired = healer.expire_verifications(now=1028.0 + healer.max_sampling_interval + 1)
+    assert [a.node_id for a in expired] == ["LATE"]
+    print("\n✅ Node that went silent after its deadline expired on a later sweep")
+
+
+def run_all_tests():
+    """Run all test scenarios"""
+    try:
+        test_stalled_node_verification_expires()
+        test_reporting_node_is_verified_by_its_next_report()
+        test_node_that_stops_after_deadline_expires_later()
+        print("\n✅ ALL TESTS PASSED")
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
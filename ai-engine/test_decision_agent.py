@@ -3,10 +3,21 @@ TEST SCRIPT FOR DECISION AGENT
 Simulates various system states to verify agent behavior
 """
 
+import os
 import sys
 import time
 from decision_agent import DecisionAgent, AgentDecision, HealthTrend
 
+# Scales the pauses between cycles that let the console output be followed live
+# (0 = no pauses, the default; AI_OPS_TEST_PACE=1 for the original demo pacing)
+_PACE = float(os.environ.get("AI_OPS_TEST_PACE", "0"))
+
+
+def _pace(seconds):
+    """Pause between cycles when pacing is enabled"""
+    if _PACE:
+        time.sleep(seconds * _PACE)
+
 
 def print_decision(reasoning, cycle):
     """Pretty print agent decision"""
@@ -46,7 +57,7 @@ def test_scenario_1_normal_operation():
         )
         
         print_decision(reasoning, cycle + 1)
-        time.sleep(0.5)
+        _pace(0.5)
     
     # Verify: Should be NO_ACTION with high confidence
     assert reasoning.decision == "NO_ACTION"
@@ -76,7 +87,7 @@ def test_scenario_2_gradual_degradation():
         )
         
         print_decision(reasoning, cycle + 1)
-        time.sleep(0.5)
+        _pace(0.5)
     
     # Verify: Should ESCALATE after persistence threshold
     assert reasoning.decision == "ESCALATE"
@@ -106,7 +117,7 @@ def test_scenario_3_critical_failure():
         )
         
         print_decision(reasoning, cycle + 1)
-        time.sleep(0.5)
+        _pace(0.5)
     
     # Verify: Should predict failure or auto-heal
     assert reasoning.decision in ["PREDICT_FAILURE", "AUTO_HEAL"]
@@ -133,7 +144,7 @@ def test_scenario_4_recovery():
             root_cause="CPU"
         )
         print_decision(reasoning, cycle + 1)
-        time.sleep(0.3)
+        _pace(0.3)
     
     # Now recover
     health_scores = [65, 72, 78, 82]  # Recovery
@@ -145,7 +156,7 @@ def test_scenario_4_recovery():
             root_cause=None
         )
         print_decision(reasoning, cycle)
-        time.sleep(0.3)
+        _pace(0.3)
     
     # Verify: Should DE_ESCALATE after sustained recovery
     assert reasoning.decision == "DE_ESCALATE"
@@ -0,0 +1,113 @@
+"""
+TEST SCRIPT FOR EXPLANATION ENGINE
+Verifies how batched Ollama replies are split back per decision (Ollama is mocked)
+"""
+
+import asyncio
+import json
+import sys
+import httpx
+from explanation_engine import ExplanationEngine, ExplanationRequest, BATCH_PROMPT_SIZE
+
+
+def make_request(decision="ESCALATE", root_cause="cpu", persistence=3, confidence=0.8):
+    return ExplanationRequest(
+        decision=decision,
+        root_cause=root_cause,
+        health_trend="DEGRADING",
+        persistence=persistence,
+        action_taken=None,
+        confidence=confidence,
+        contributing_factors=[]
+    )
+
+
+def mock_engine(reply):
+    """
+    Engine whose Ollama calls are answered by reply(prompt) -> text.
+    Returns the engine and the list of captured request bodies.
+    """
+    calls = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        body["timeout"] = request.extensions["timeout"]["read"]
+        calls.append(body)
+        return httpx.Response(200, json={"response": reply(body["prompt"])})
+
+    engine = ExplanationEngine(timeout_seconds=15.0)
+    engine.available = True
+    engine._client = httpx.AsyncClient(base_url=engine.ollama_url, transport=httpx.MockTransport(handler))
+    return engine, calls
+
+
+def test_batch_reply_parsing():
+    """Test: Out-of-order, duplicated, missing and out-of-range answer numbers"""
+    reply = "Here you go:\n3. Third answer\n1) First answer\n1. Duplicate of first\n9. No such decision\n"
+    engine, calls = mock_engine(lambda prompt: reply)
+    requests = [make_request(root_cause=cause) for cause in ("cpu", "memory", "disk")]
+
+    responses = asyncio.run(engine.explain_batch(requests))
+
+    assert len(calls) == 1
+    assert [r.explanation for r in responses][0::2] == ["First answer", "Third answer"]
+    assert [r.generated_by for r in responses] == ["ollama", "fallback", "ollama"]
+    assert responses[1].explanation == engine._generate_fallback(requests[1])
+    # Only answered decisions are cached
+    assert engine._get_cached(engine._cache_key(requests[1])) is None
+    assert engine._get_cached(engine._cache_key(requests[2])) == "Third answer"
+    print("\n✅ Batched reply split per decision")
+
+
+def test_batch_mixes_cache_direct_and_duplicates():
+    """Test: Cached and DIRECT decisions never reach Ollama; duplicate misses are asked once"""
+    engine, calls = mock_engine(lambda prompt: "1. Memory answer")
+    cached = make_request(root_cause="cpu")
+    engine._cache_explanation(engine._cache_key(cached), "Cached answer")
+    direct = make_request(decision="NO_ACTION")
+    miss = make_request(root_cause="memory")
+
+    responses = asyncio.run(engine.explain_batch([cached, direct, miss, miss]))
+
+    assert len(calls) == 1
+    assert calls[0]["prompt"].count("Decision:") == 1
+    assert [r.generated_by for r in responses] == ["cache", "direct", "ollama", "ollama"]
+    assert responses[0].explanation == "Cached answer"
+    assert responses[2].explanation == responses[3].explanation == "Memory answer"
+    print("\n✅ Cache, direct and duplicate decisions handled")
+
+
+def test_batch_is_chunked_with_scaled_timeout():
+    """Test: Misses are split into prompts of BATCH_PROMPT_SIZE with a timeout per decision"""
+    def reply(prompt):
+        count = prompt.count("Decision:")
+        return "\n".join(f"{i}. Answer {i} of {count}" for i in range(1, count + 1))
+
+    engine, calls = mock_engine(reply)
+    requests = [make_request(persistence=p, confidence=c) for p in (1, 10) for c in (0.2, 0.5, 0.8)]
+
+    responses = asyncio.run(engine.explain_batch(requests))
+
+    sizes = [call["prompt"].count("Decision:") for call in calls]
+    assert sorted(sizes) == sorted([BATCH_PROMPT_SIZE, len(requests) - BATCH_PROMPT_SIZE])
+    for call, size in zip(calls, sizes):
+        assert call["options"]["num_predict"] == 50 * size
+        assert call["timeout"] == engine.timeout_seconds * size
+    assert all(r.generated_by == "ollama" for r in responses)
+    print("\n✅ Batch split into chunked prompts")
+
+
+def run_all_tests():
+    """Run all test scenarios"""
+    try:
+        test_batch_reply_parsing()
+        test_batch_mixes_cache_direct_and_duplicates()
+        test_batch_is_chunked_with_scaled_timeout()
+        print("\n✅ ALL TESTS PASSED")
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -6,7 +6,7 @@ const { Server } = require("socket.io");
 
 const setupSocket = require("./socket");
 const { getTimeline } = require("./services/incidentManager");
-const { processAgentMetrics, initConnectionChecker, getActiveNodes, getConnectionStats } = require("./services/nodeManager");
+const { processAgentMetrics, processAgentMetricsBatch, initConnectionChecker, getActiveNodes, getConnectionStats } = require("./services/nodeManager");
 
 const app = express();
 app.use(cors());
@@ -89,6 +89,40 @@ app.post("/agent/metrics", async (req, res) => {
   }
 });
 
+// POST /agent/metrics/batch - Receives several cycles from one agent in a single request
+// Entries are processed in order as if each had been POSTed to /agent/metrics, but the
+// AI Engine gets them in one /agent/metrics/batch call (one explanation pass for the batch)
+app.post("/agent/metrics/batch", async (req, res) => {
+  const { node_id, batch } = req.body;
+
+  if (!node_id || !Array.isArray(batch) || batch.length === 0) {
+    return res.status(400).json({
+      error: "Missing required fields: node_id and batch",
+      received: { node_id: !!node_id, batch: Array.isArray(batch) }
+    });
+  }
+
+  try {
+    const { processed, rejected, result } = await processAgentMetricsBatch(io, node_id, batch);
+
+    res.json({
+      status: "ok",
+      node_id,
+      processed,
+      rejected,
+      connection_state: "CONNECTED",
+      agent_status: result.agent_status || "ACTIVE"
+    });
+  } catch (err) {
+    console.error(`[AGENT] Error processing batch for ${node_id}:`, err.message);
+    res.status(err.message.includes("rejected") ? 400 : 500).json({
+      error: err.message || "Failed to process metrics",
+      node_id,
+      processed: 0
+    });
+  }
+});
+
 // GET /nodes - Returns list of all nodes with connection state
 app.get("/nodes", (req, res) => {
   const nodes = getActiveNodes();
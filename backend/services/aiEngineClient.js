@@ -18,6 +18,28 @@ async function fetchMetrics() {
   }
 }
 
+/**
+ * Build the AI Engine request body for one agent report
+ */
+function buildAIEnginePayload(nodeId, metrics, agentState, heartbeat) {
+  const payload = {
+    node_id: nodeId,
+    metrics: metrics
+  };
+  
+  // Include agent_state if provided (for accurate decision-making)
+  if (agentState) {
+    payload.agent_state = agentState;
+  }
+  
+  // Include heartbeat if provided
+  if (heartbeat) {
+    payload.heartbeat = heartbeat;
+  }
+  
+  return payload;
+}
+
 /**
  * Send agent metrics to AI Engine for processing (multi-node support)
  * @param {string} nodeId - Unique identifier for the node
@@ -28,20 +50,7 @@ async function fetchMetrics() {
  */
 async function sendMetricsToAIEngine(nodeId, metrics, agentState = null, heartbeat = null) {
   try {
-    const payload = {
-      node_id: nodeId,
-      metrics: metrics
-    };
-    
-    // Include agent_state if provided (for accurate decision-making)
-    if (agentState) {
-      payload.agent_state = agentState;
-    }
-    
-    // Include heartbeat if provided
-    if (heartbeat) {
-      payload.heartbeat = heartbeat;
-    }
+    const payload = buildAIEnginePayload(nodeId, metrics, agentState, heartbeat);
     
     const response = await axios.post(
       `${AI_ENGINE_URL}/agent/metrics`,
@@ -55,4 +64,27 @@ async function sendMetricsToAIEngine(nodeId, metrics, agentState = null, heartbe
   }
 }
 
-module.exports = { fetchMetrics, sendMetricsToAIEngine };
+/**
+ * Send several agent reports to AI Engine in one request (explanations are generated together)
+ * @param {Array} reports - [{ node_id, metrics, agent_state, heartbeat }, ...] in processing order
+ * @returns {Array} One AI-enriched result per report, in order
+ */
+async function sendMetricsBatchToAIEngine(reports) {
+  try {
+    const items = reports.map(({ node_id, metrics, agent_state, heartbeat }) =>
+      buildAIEnginePayload(node_id, metrics, agent_state, heartbeat)
+    );
+    
+    const response = await axios.post(
+      `${AI_ENGINE_URL}/agent/metrics/batch`,
+      { items },
+      { timeout: 10000 * items.length }  // Same budget per report as sendMetricsToAIEngine
+    );
+    return response.data.results;
+  } catch (error) {
+    console.error(`Failed to send metrics batch to AI Engine: ${error.message}`);
+    throw error;
+  }
+}
+
+module.exports = { fetchMetrics, sendMetricsToAIEngine, sendMetricsBatchToAIEngine };
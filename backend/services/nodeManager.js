@@ -10,7 +10,7 @@
  * - Broadcasts accurate connection state
  */
 
-const { sendMetricsToAIEngine } = require("./aiEngineClient");
+const { sendMetricsToAIEngine, sendMetricsBatchToAIEngine } = require("./aiEngineClient");
 const { updateState } = require("./incidentManager");
 
 // In-memory store: { node_id: { hostname, metrics, lastSeen, aiResult, status, agentState, heartbeat } }
@@ -165,12 +165,10 @@ function initConnectionChecker(io) {
 }
 
 /**
- * Process metrics received from a distributed agent
- * HARDENED: Validates all inputs, tracks heartbeats, ensures consistency
- * @param {Server} io - Socket.IO server instance
- * @param {Object} payload - { node_id, hostname, metrics, agent_state, heartbeat }
+ * Validate an agent payload and record it in the node store (everything before the AI Engine call)
+ * @returns {string} Agent status (ACTIVE/DEGRADED/RECOVERING)
  */
-async function processAgentMetrics(io, payload) {
+function acceptAgentPayload(io, payload) {
   const { node_id, hostname, metrics, agent_state, heartbeat } = payload;
   
   // VALIDATION: Strict input validation
@@ -230,9 +228,15 @@ async function processAgentMetrics(io, payload) {
     });
   }
 
-  // Forward to AI Engine for processing (with node_id AND agent_state)
-  // This enables the decision agent to make accurate decisions based on real PC agent state
-  const aiResult = await sendMetricsToAIEngine(node_id, metrics, agent_state, heartbeat);
+  return agentStatus;
+}
+
+/**
+ * Store an AI Engine result for an accepted payload and emit it to the frontend
+ * @returns {Object} Enriched metrics (as emitted in system_metrics)
+ */
+function publishAIResult(io, payload, agentStatus, aiResult) {
+  const { node_id, hostname, agent_state } = payload;
 
   // Store AI result for this node
   nodeStore[node_id].aiResult = aiResult;
@@ -271,6 +275,53 @@ async function processAgentMetrics(io, payload) {
   return enrichedMetrics;
 }
 
+/**
+ * Process metrics received from a distributed agent
+ * HARDENED: Validates all inputs, tracks heartbeats, ensures consistency
+ * @param {Server} io - Socket.IO server instance
+ * @param {Object} payload - { node_id, hostname, metrics, agent_state, heartbeat }
+ */
+async function processAgentMetrics(io, payload) {
+  const agentStatus = acceptAgentPayload(io, payload);
+  const { node_id, metrics, agent_state, heartbeat } = payload;
+
+  // Forward to AI Engine for processing (with node_id AND agent_state)
+  // This enables the decision agent to make accurate decisions based on real PC agent state
+  const aiResult = await sendMetricsToAIEngine(node_id, metrics, agent_state, heartbeat);
+
+  return publishAIResult(io, payload, agentStatus, aiResult);
+}
+
+/**
+ * Process several cycles from one agent with a single AI Engine request
+ * Entries are accepted, then published in order; rejected entries (malformed or stale,
+ * e.g. samples an agent kept while the backend was down) are skipped instead of failing the batch.
+ * @returns {Object} { processed, rejected, result } - result is the last entry's enriched metrics
+ */
+async function processAgentMetricsBatch(io, node_id, batch) {
+  const accepted = [];
+  let rejection = null;
+  for (const { hostname, metrics, agent_state, heartbeat } of batch) {
+    const payload = { node_id, hostname, metrics, agent_state, heartbeat };
+    try {
+      accepted.push({ payload, agentStatus: acceptAgentPayload(io, payload) });
+    } catch (err) {
+      rejection = err;
+    }
+  }
+  if (accepted.length === 0) {
+    throw rejection;
+  }
+
+  const aiResults = await sendMetricsBatchToAIEngine(accepted.map(({ payload }) => payload));
+
+  let result = null;
+  accepted.forEach(({ payload, agentStatus }, i) => {
+    result = publishAIResult(io, payload, agentStatus, aiResults[i]);
+  });
+  return { processed: accepted.length, rejected: batch.length - accepted.length, result };
+}
+
 /**
  * Get list of all known nodes with their current status
  * @returns {Array} Array of { node_id, hostname, lastSeen, status, connection_state, agent_status }
@@ -352,6 +403,7 @@ function getConnectionStats() {
 
 module.exports = {
   processAgentMetrics,
+  processAgentMetricsBatch,
   getActiveNodes,
   getNodeData,
   getConnectionStats,